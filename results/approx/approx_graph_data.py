@@ -0,0 +1,95 @@
+import csv
+import os
+import random
+
+from src.dna_hash import dna_hash
+from src.double_hash import double_hash
+from src.linear_search import linear_search
+from src.rabin_karp import RabinKarp
+from src.text_cache import load_text
+
+approx_file_name = "dna.txt"
+
+
+def save_to_csv(data, filename=f"results/approx/approx_graph_data_{approx_file_name[:-4]}.csv"):
+    with open(filename, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+
+        # Заголовки CSV
+        writer.writerow([
+            'hash_function',
+            'pattern_length',
+            'k',
+            'time_ms',
+            'collisions',
+            'checks',
+            'candidates',
+            'verify_chars',
+            'matches'
+        ])
+
+        for row in data:
+            writer.writerow(row)
+
+    return filename
+
+
+def mutate(pattern: str, k: int, alphabet: str = "ACGT", seed: int = 0) -> str:
+    # k замен в случайных позициях: паттерн точно находится с k несовпадениями
+    rng = random.Random(seed)
+    chars = list(pattern)
+    for position in rng.sample(range(len(chars)), k):
+        chars[position] = rng.choice(alphabet.replace(chars[position], ""))
+    return "".join(chars)
+
+
+def create_approx_metrics():
+    ##############################################################
+    # ИЗМЕНЯЕМЫЕ ПАРАМЕТРЫ
+
+    # Длины паттернов и допустимое число несовпадений
+    lengths = [20, 50, 100, 200]
+    ks = [0, 1, 2, 4, 8]
+
+    # linear_search - наивный проход с проверкой Хэмминга в каждом окне
+    hash_functions = [
+        ("linear_search", linear_search),
+        ("double_hash", double_hash),
+        ("dna_hash", dna_hash),
+    ]
+    ##############################################################
+
+    path_to_file = f"texts/{approx_file_name}"
+    if not os.path.exists(path_to_file):
+        print(f"Файл {path_to_file} не найден!")
+        return
+
+    text = load_text(path_to_file)
+    if not text:
+        print("Ошибка: не удалось загрузить текст")
+        return
+
+    print("=" * 70)
+    print("ТЕСТИРОВАНИЕ ПОИСКА С НЕСОВПАДЕНИЯМИ")
+    print(f"Файл: {path_to_file}")
+    print(f"Длина текста: {len(text)} символов")
+
+    csv_data = []
+
+    for length in lengths:
+        start = min(1000, len(text) - length)
+        for k in ks:
+            pattern = mutate(text[start:start + length], k)
+
+            for hash_name, hash_func in hash_functions:
+                algorithm = RabinKarp(hash_func, hash_name=hash_name)
+                matches = len(algorithm.findall_approx(pattern, text, k))
+                stats = algorithm.get_stats()
+                csv_data.append([hash_name, length, k, stats['time_ms'], stats['collisions'], stats['checks'],
+                                 stats['approx_candidates'], stats['approx_verify_chars'], matches])
+                print(f"m={length:4d} k={k:2d} {hash_name:14s} | {stats['time_ms']:8.1f} мс | "
+                      f"кандидатов {stats['approx_candidates']:6d} | совпадений {matches}")
+
+    csv_filename = save_to_csv(csv_data)
+    print(f"CSV данные для графиков: {csv_filename}")
+    print("РАБОТА ПО СОЗДАНИЮ МЕТРИК APPROX ОКОНЧЕНА УСПЕШНО")
@@ -0,0 +1,224 @@
+"""
+НАБОР БЕНЧМАРКОВ: ПРОГРЕВ, ПОВТОРЫ, СТАТИСТИКА
+
+Каждое сочетание текст x хеш-функция x длина паттерна эксперимента "time"
+(results/experiments.json) прогоняется warmup раз вхолостую и repeats раз
+под таймером; на время замеров отключается сборщик мусора. В CSV пишется прежняя схема
+time_graph_data (time_ms - медиана) плюс min / median / p95 / stddev
+и пропускная способность (просмотренные символы в секунду). С --profile
+добавляются столбцы профиля по фазам (src/instrumentation.py).
+
+Регрессия: медиана сравнивается с сохранённым базовым CSV; замер падает,
+если стал медленнее больше чем на threshold (доля) и больше чем на
+min_delta_ms (чтобы шум на микросекундных замерах не давал ложных срабатываний).
+
+    python -m results.benchmark.benchmark_graph_data --save-baseline
+    python -m results.benchmark.benchmark_graph_data --check --threshold 0.2
+"""
+import argparse
+import csv
+import gc
+import math
+import os
+import shutil
+import statistics
+import sys
+import time
+
+from results import experiments
+from src.instrumentation import PROFILE_COLUMNS
+from src.rabin_karp import RabinKarp
+from src.text_cache import load_text
+
+benchmark_csv = "results/benchmark/benchmark_graph_data.csv"
+baseline_csv = "results/benchmark/benchmark_baseline.csv"
+
+CSV_HEADER = [
+    'hash_function',
+    'pattern_length',
+    'time_ms',
+    'collisions',
+    'checks',
+    'found',
+    'position',
+    'text',
+    'repeats',
+    'min_ms',
+    'median_ms',
+    'p95_ms',
+    'stddev_ms',
+    'throughput_chars_per_sec'
+]
+
+
+def measure(func, warmup: int, repeats: int) -> list:
+    """Время repeats вызовов func (нс) после warmup холостых; GC отключён на время замеров"""
+    for _ in range(warmup):
+        func()
+
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = []
+        for _ in range(repeats):
+            start_time = time.perf_counter_ns()
+            func()
+            timings.append(time.perf_counter_ns() - start_time)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return timings
+
+
+def percentile(values: list, q: float) -> float:
+    # Линейная интерполяция между соседними порядковыми статистиками
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * q
+    lo, hi = math.floor(k), math.ceil(k)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(timings: list, scanned_chars: int) -> dict:
+    median_ns = statistics.median(timings)
+    return {
+        "min_ms": min(timings) / 1_000_000,
+        "median_ms": median_ns / 1_000_000,
+        "p95_ms": percentile(timings, 0.95) / 1_000_000,
+        "stddev_ms": (statistics.stdev(timings) if len(timings) > 1 else 0.0) / 1_000_000,
+        "throughput_chars_per_sec": scanned_chars / (median_ns / 1_000_000_000) if median_ns else 0.0,
+    }
+
+
+def save_to_csv(data, filename=benchmark_csv, profile: bool = False):
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+    with open(filename, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_HEADER + (PROFILE_COLUMNS if profile else []))
+        for row in data:
+            writer.writerow(row)
+
+    return filename
+
+
+def create_benchmark_metrics(warmup: int = 2, repeats: int = 10, profile: bool = False):
+    # profile - дописать столбцы профиля по фазам (отдельный инструментированный
+    # прогон, чтобы накладные расходы таймеров не попали в min / median / p95)
+    ##############################################################
+    # ИЗМЕНЯЕМЫЕ ПАРАМЕТРЫ - results/experiments.json, эксперимент "time"
+    experiment = experiments.experiment("time")
+    pattern_lengths = experiment["lengths"]
+    hash_functions = experiments.hash_functions(experiment)
+    ##############################################################
+
+    csv_data = []
+    for file_name in experiment["texts"]:
+        path_to_file = os.path.join(experiment["texts_dir"], file_name)
+        text = load_text(path_to_file)
+        if not text:
+            print(f"Пропускаем пустой файл {path_to_file}")
+            continue
+
+        print("=" * 70)
+        print(f"Файл: {path_to_file} | {len(text)} символов | прогрев {warmup}, повторов {repeats}")
+
+        for pattern_len in pattern_lengths:
+            if pattern_len > len(text):
+                continue
+            pattern = experiments.make_pattern(experiment["pattern"], text, pattern_len)
+
+            for hash_name, hash_func in hash_functions:
+                algorithm = RabinKarp(hash_func, hash_name=hash_name)
+                timings = measure(lambda: algorithm.find(pattern, text), warmup, repeats)
+
+                # Счётчики детерминированы - берём из последнего прогона
+                position = algorithm.find(pattern, text)
+                stats = algorithm.get_stats()
+                scanned = position + pattern_len if position != -1 else len(text)
+                summary = summarize(timings, scanned)
+
+                csv_data.append([
+                    hash_name,
+                    pattern_len,
+                    summary['median_ms'],
+                    stats['collisions'],
+                    stats['checks'],
+                    position != -1,
+                    position,
+                    file_name,
+                    repeats,
+                    summary['min_ms'],
+                    summary['median_ms'],
+                    summary['p95_ms'],
+                    summary['stddev_ms'],
+                    summary['throughput_chars_per_sec']
+                ])
+
+                if profile:
+                    profiled = RabinKarp(hash_func, hash_name=hash_name, instrument=True)
+                    profiled.find(pattern, text)
+                    record = profiled.profile.to_dict()
+                    csv_data[-1].extend(record[column] for column in PROFILE_COLUMNS)
+
+    csv_filename = save_to_csv(csv_data, profile=profile)
+    print(f"CSV данные бенчмарка: {csv_filename}")
+    return csv_filename
+
+
+def _read_medians(filename: str) -> dict:
+    with open(filename, 'r', encoding='utf-8', newline='') as csvfile:
+        return {(row['text'], row['hash_function'], int(row['pattern_length'])): float(row['median_ms'])
+                for row in csv.DictReader(csvfile)}
+
+
+def check_regression(current=benchmark_csv, baseline=baseline_csv,
+                     threshold: float = 0.2, min_delta_ms: float = 0.05) -> list:
+    """
+    Замеры, медиана которых выросла больше чем на threshold относительно базы.
+    Возвращает список (текст, хеш-функция, длина, база_мс, сейчас_мс).
+    """
+    base = _read_medians(baseline)
+    regressions = []
+    for key, median_ms in _read_medians(current).items():
+        if key not in base:
+            continue
+        base_ms = base[key]
+        if median_ms > base_ms * (1 + threshold) and median_ms - base_ms > min_delta_ms:
+            regressions.append((*key, base_ms, median_ms))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарк RabinKarp с прогревом и повторами")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--save-baseline", action="store_true", help="сохранить результат как базу")
+    parser.add_argument("--check", action="store_true", help="сравнить с базой")
+    parser.add_argument("--threshold", type=float, default=0.2, help="допустимое замедление (доля)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05)
+    parser.add_argument("--profile", action="store_true", help="добавить столбцы профиля по фазам")
+    args = parser.parse_args(argv)
+
+    csv_filename = create_benchmark_metrics(args.warmup, args.repeats, args.profile)
+
+    if args.save_baseline:
+        shutil.copyfile(csv_filename, baseline_csv)
+        print(f"База сохранена в: {baseline_csv}")
+
+    if args.check:
+        if not os.path.exists(baseline_csv):
+            print(f"База {baseline_csv} не найдена, запустите с --save-baseline")
+            return 2
+        regressions = check_regression(csv_filename, baseline_csv, args.threshold, args.min_delta_ms)
+        for text_name, hash_name, pattern_len, base_ms, median_ms in regressions:
+            print(f"РЕГРЕССИЯ {text_name} | {hash_name} | {pattern_len}: "
+                  f"{base_ms:.4f} мс -> {median_ms:.4f} мс (x{median_ms / base_ms:.2f})")
+        if regressions:
+            return 1
+        print("Регрессий нет")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+ОПИСАНИЕ ЭКСПЕРИМЕНТОВ
+
+Тексты, хеш-функции, длины и источники паттернов задаются в experiments.json:
+    texts_dir, texts           - корпуса (по умолчанию для всех экспериментов)
+    experiments.<имя>.hashes   - имена из HASH_FUNCTIONS
+    experiments.<имя>.engines  - необязательно, другие движки поиска из ENGINES
+                                 (строятся по тексту один раз, время - только запрос)
+    experiments.<имя>.lengths  - длины паттернов
+    experiments.<имя>.pattern  - источник паттерна:
+        {"source": "text", "start": 1000}    - кусок самого текста с позиции start
+                                               (или раньше, если текст короче);
+        {"source": "repeat", "alphabet": "ATCG"} - алфавит, повторённый до длины
+    experiments.<имя>.repeats  - повторы замера (time_ms - медиана)
+    experiments.<имя>.texts    - необязательно, свой список корпусов
+"""
+import json
+import os
+
+from src.chetsum_hash import chetsum_hash
+from src.dna_hash import dna_hash
+from src.double_hash import double_hash
+from src.first_last_hash import first_last_hash
+from src.hash_simple import simple_hash
+from src.linear_search import linear_search
+from src.lite_crc32 import rolling_crc32
+from src.suffix_array import SuffixArraySearch
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "experiments.json")
+
+HASH_FUNCTIONS = {
+    "linear_search": linear_search,
+    "simple_hash": simple_hash,
+    "first_last_hash": first_last_hash,
+    "chetsum_hash": chetsum_hash,
+    "rolling_crc32": rolling_crc32,
+    "double_hash": double_hash,
+    "dna_hash": dna_hash,
+}
+
+# Движки с интерфейсом SuffixArraySearch: engine(text).find(pattern), get_stats()
+ENGINES = {
+    "suffix_array": SuffixArraySearch,
+}
+
+
+def load_config(path: str = CONFIG_PATH) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    for name, experiment in config["experiments"].items():
+        experiment.setdefault("texts", config["texts"])
+        experiment.setdefault("repeats", 1)
+        experiment.setdefault("engines", [])
+        unknown = [h for h in experiment["hashes"] if h not in HASH_FUNCTIONS]
+        if unknown:
+            raise ValueError(f"{name}: неизвестные хеш-функции {unknown}")
+        unknown = [e for e in experiment["engines"] if e not in ENGINES]
+        if unknown:
+            raise ValueError(f"{name}: неизвестные движки {unknown}")
+        if experiment["pattern"]["source"] not in ("text", "repeat"):
+            raise ValueError(f"{name}: неизвестный источник паттерна {experiment['pattern']['source']}")
+    return config
+
+
+def experiment(name: str, path: str = CONFIG_PATH) -> dict:
+    config = load_config(path)
+    return dict(config["experiments"][name], texts_dir=config["texts_dir"])
+
+
+def hash_functions(experiment: dict) -> list:
+    # [(имя, функция)] в порядке конфига
+    return [(name, HASH_FUNCTIONS[name]) for name in experiment["hashes"]]
+
+
+def make_pattern(spec: dict, text: str, length: int) -> str:
+    if spec["source"] == "repeat":
+        alphabet = spec["alphabet"]
+        return (alphabet * (length // len(alphabet) + 1))[:length]
+    start = min(spec.get("start", 0), len(text) - length)
+    return text[start:start + length]
+
+
+def pattern_key(spec: dict) -> str:
+    # Эксперименты с одинаковым источником паттерна делят замеры
+    return json.dumps(spec, sort_keys=True)
@@ -1,12 +1,15 @@
 import matplotlib.pyplot as plt
 import pandas as pd
 
+from results.approx.approx_graph_data import approx_file_name
 from results.checks.checks_graph_data import checks_file_name
 from results.collizion.collizion_graph_data import collizion_file_name
+from results.parallel.parallel_graph_data import parallel_file_name
 from results.time.time_graph_data import time_file_name
 
 
-def create_time_graphs(csv_file=f"results/time/time_graph_data_{time_file_name[:-4]}.csv"):
+def create_time_graphs(csv_file=None, file_name=time_file_name):
+    csv_file = csv_file or f"results/time/time_graph_data_{file_name[:-4]}.csv"
     df = pd.read_csv(csv_file)
 
     # 1. ГРАФИК ВРЕМЕНИ РАБОТЫ
@@ -17,7 +20,9 @@ def create_time_graphs(csv_file=f"results/time/time_graph_data_{time_file_name[:
               'first_last_hash': 'red',
               'rolling_crc32': 'purple',
               'double_hash': 'orange',
+              'dna_hash': 'teal',
               'linear_search': 'black',
+              'suffix_array': 'brown',
               }
 
     for hash_func in df['hash_function'].unique():
@@ -31,20 +36,21 @@ def create_time_graphs(csv_file=f"results/time/time_graph_data_{time_file_name[:
 
     plt.xlabel("Длина паттерна (символы)", fontsize=14)
     plt.ylabel("Время работы (миллисекунды)", fontsize=14)
-    plt.title(f"Влияние хеш-функции на время  ({time_file_name})",
+    plt.title(f"Влияние хеш-функции на время  ({file_name})",
               fontsize=16, fontweight='bold', pad=20)
     plt.legend(fontsize=12, title="Хеш-функции", title_fontsize=13)
     plt.grid(True, alpha=0.3)
     plt.xscale('linear')
     plt.yscale('linear')
     plt.tight_layout()
-    plt.savefig(f"results/time/time_graph_data_{time_file_name[:-4]}.png", dpi=300)
+    plt.savefig(f"results/time/time_graph_data_{file_name[:-4]}.png", dpi=300)
     print("TIME GRAPH СОЗДАН")
     return df
 
 
-def create_collizion_graphs(csv_file=f"results/collizion/collision_graph_data_{collizion_file_name[:-4]}.csv"):
+def create_collizion_graphs(csv_file=None, file_name=collizion_file_name):
     # 2. ГРАФИК КОЛЛИЗИЙ
+    csv_file = csv_file or f"results/collizion/collision_graph_data_{file_name[:-4]}.csv"
     df = pd.read_csv(csv_file)
 
     plt.figure(figsize=(14, 8))
@@ -54,6 +60,7 @@ def create_collizion_graphs(csv_file=f"results/collizion/collision_graph_data_{c
               'first_last_hash': 'red',
               'rolling_crc32': 'purple',
               'double_hash': 'orange',
+              'dna_hash': 'teal',
               }
 
     for hash_func in df['hash_function'].unique():
@@ -67,7 +74,7 @@ def create_collizion_graphs(csv_file=f"results/collizion/collision_graph_data_{c
 
     plt.xlabel("Длина паттерна (символы)", fontsize=14)
     plt.ylabel("Количество коллизий", fontsize=14)
-    plt.title(f"Качество хеширования - количество коллизий ({collizion_file_name})",
+    plt.title(f"Качество хеширования - количество коллизий ({file_name})",
               fontsize=16, fontweight='bold', pad=20)
 
     plt.xscale('linear')
@@ -77,13 +84,14 @@ def create_collizion_graphs(csv_file=f"results/collizion/collision_graph_data_{c
     plt.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig(f"results/collizion/collizion_graph_data_{collizion_file_name[:-4]}.png", dpi=300)
+    plt.savefig(f"results/collizion/collizion_graph_data_{file_name[:-4]}.png", dpi=300)
     # plt.show()
 
     return df
 
 
-def create_checks_graphs(csv_file=f"results/checks/checks_graph_data_{checks_file_name[:-4]}.csv"):
+def create_checks_graphs(csv_file=None, file_name=checks_file_name):
+    csv_file = csv_file or f"results/checks/checks_graph_data_{file_name[:-4]}.csv"
     df = pd.read_csv(csv_file)
 
     fig, ax1 = plt.subplots(figsize=(14, 8))
@@ -95,6 +103,7 @@ def create_checks_graphs(csv_file=f"results/checks/checks_graph_data_{checks_fil
         'first_last_hash': 'red',
         'rolling_crc32': 'purple',
         'double_hash': 'orange',
+        'dna_hash': 'teal',
         'linear_search': 'black',
     }
 
@@ -126,7 +135,7 @@ def create_checks_graphs(csv_file=f"results/checks/checks_graph_data_{checks_fil
     ax1.set_ylabel("Проверки (хеш-функции)", fontsize=14, color='blue')
     ax2.set_ylabel("Проверки (linear_search)", fontsize=14, color='black')
 
-    plt.title(f"График проверок ({checks_file_name})",
+    plt.title(f"График проверок ({file_name})",
               fontsize=16, fontweight='bold', pad=20)
 
     #  легенды
@@ -137,6 +146,104 @@ def create_checks_graphs(csv_file=f"results/checks/checks_graph_data_{checks_fil
 
     ax1.grid(True, alpha=0.3)
     plt.tight_layout()
-    plt.savefig(f"results/checks/checks_graph_data_{checks_file_name[:-4]}.png", dpi=300)
+    plt.savefig(f"results/checks/checks_graph_data_{file_name[:-4]}.png", dpi=300)
+
+    return df
+
+
+def create_parallel_graphs(csv_file=f"results/parallel/parallel_graph_data_{parallel_file_name[:-4]}.csv"):
+    # 4. КРИВАЯ УСКОРЕНИЯ ПАРАЛЛЕЛЬНОГО ПОИСКА
+    df = pd.read_csv(csv_file)
+    df = df[df['workers'] > 0]
+
+    plt.figure(figsize=(14, 8))
+    plt.plot(df['workers'], df['speedup'],
+             marker='o',
+             label='double_hash',
+             color='orange',
+             linewidth=2.5,
+             markersize=8)
+    plt.plot(df['workers'], df['workers'],
+             label='идеальное ускорение',
+             color='black',
+             linestyle='--')
+
+    plt.xlabel("Количество процессов", fontsize=14)
+    plt.ylabel("Ускорение относительно RabinKarp.find", fontsize=14)
+    plt.title(f"Параллельный поиск по шардам ({parallel_file_name})",
+              fontsize=16, fontweight='bold', pad=20)
+    plt.legend(fontsize=12)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(f"results/parallel/parallel_graph_data_{parallel_file_name[:-4]}.png", dpi=300)
+
+    return df
+
+
+def create_approx_graphs(csv_file=f"results/approx/approx_graph_data_{approx_file_name[:-4]}.csv"):
+    # 5. ПОИСК С НЕСОВПАДЕНИЯМИ: ВРЕМЯ ОТ k (ОТДЕЛЬНО ДЛЯ КАЖДОЙ ДЛИНЫ ПАТТЕРНА)
+    df = pd.read_csv(csv_file)
+    lengths = sorted(df['pattern_length'].unique())
+
+    colors = {'linear_search': 'black',
+              'double_hash': 'orange',
+              'dna_hash': 'teal',
+              }
+
+    fig, axes = plt.subplots(1, len(lengths), figsize=(5 * len(lengths), 6), sharey=True, squeeze=False)
+    for ax, length in zip(axes[0], lengths):
+        subset = df[df['pattern_length'] == length]
+        for hash_func in subset['hash_function'].unique():
+            data = subset[subset['hash_function'] == hash_func]
+            ax.plot(data['k'], data['time_ms'],
+                    marker='o',
+                    label='наивный Хэмминг' if hash_func == 'linear_search' else hash_func,
+                    color=colors.get(hash_func, 'black'),
+                    linewidth=2.5,
+                    markersize=8)
+        ax.set_title(f"m = {length}", fontsize=14)
+        ax.set_xlabel("Допустимые несовпадения k", fontsize=12)
+        ax.grid(True, alpha=0.3)
+
+    axes[0][0].set_ylabel("Время (мс)", fontsize=12)
+    axes[0][0].legend(fontsize=11)
+    fig.suptitle(f"Поиск с k несовпадениями ({approx_file_name})", fontsize=16, fontweight='bold')
+    plt.tight_layout()
+    plt.savefig(f"results/approx/approx_graph_data_{approx_file_name[:-4]}.png", dpi=300)
+
+    return df
+
+
+def create_winnowing_graphs(csv_file="results/winnowing/winnowing_graph_data.csv"):
+    # 6. WINNOWING: ВРЕМЯ ОТ РАЗМЕРА КОРПУСА (ОТПЕЧАТКИ + СОЕДИНЕНИЕ)
+    df = pd.read_csv(csv_file)
+
+    plt.figure(figsize=(14, 8))
+    plt.plot(df['total_chars'], df['time_ms'],
+             marker='o',
+             label='всего',
+             color='orange',
+             linewidth=2.5,
+             markersize=8)
+    plt.plot(df['total_chars'], df['fingerprint_ms'],
+             marker='s',
+             label='отпечатки',
+             color='teal',
+             linewidth=2,
+             markersize=6)
+    plt.plot(df['total_chars'], df['join_ms'],
+             marker='^',
+             label='соединение и проверка',
+             color='purple',
+             linewidth=2,
+             markersize=6)
+
+    plt.xlabel("Размер корпуса (символов)", fontsize=14)
+    plt.ylabel("Время (мс)", fontsize=14)
+    plt.title("Поиск общих фрагментов (winnowing)", fontsize=16, fontweight='bold', pad=20)
+    plt.legend(fontsize=12)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig("results/winnowing/winnowing_graph_data.png", dpi=300)
 
     return df
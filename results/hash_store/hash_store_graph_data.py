@@ -0,0 +1,112 @@
+import csv
+import os
+import time
+import tracemalloc
+
+import numpy as np
+
+from src import numpy_backend
+from src.double_hash import double_hash
+from src.hash_store import WindowHashStore
+from src.strategies import make_strategy
+from src.text_cache import load_text
+
+hash_store_file_name = "war_and_peace.txt"
+
+
+def save_to_csv(data, filename=f"results/hash_store/hash_store_graph_data_{hash_store_file_name[:-4]}.csv"):
+    with open(filename, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+
+        # Заголовки CSV
+        writer.writerow([
+            'window_length',
+            'windows',
+            'distinct',
+            'dict_bytes_per_window',
+            'store_bytes_per_window',
+            'ratio',
+            'dict_lookup_ns',
+            'store_lookup_ns'
+        ])
+
+        for row in data:
+            writer.writerow(row)
+
+    return filename
+
+
+def dict_of_lists(hashes) -> dict:
+    # Как хранились бы хеши окон без WindowHashStore: хеш -> список позиций
+    table = {}
+    for position, h in enumerate(hashes):
+        table.setdefault(h, []).append(position)
+    return table
+
+
+def create_hash_store_metrics():
+    ##############################################################
+    # ИЗМЕНЯЕМЫЕ ПАРАМЕТРЫ
+
+    # Длины окон
+    window_lengths = [4, 8, 16, 32]
+
+    # Запросов на замер времени поиска (половина - отсутствующие хеши)
+    queries_count = 100_000
+    ##############################################################
+
+    path_to_file = f"texts/{hash_store_file_name}"
+    if not os.path.exists(path_to_file):
+        print(f"Файл {path_to_file} не найден!")
+        return
+
+    text = load_text(path_to_file)
+    if not text:
+        print("Ошибка: не удалось загрузить текст")
+        return
+
+    print("=" * 70)
+    print("ПАМЯТЬ ХРАНИЛИЩА ХЕШЕЙ ОКОН (double_hash)")
+    print(f"Файл: {path_to_file}")
+    print(f"Длина текста: {len(text)} символов")
+
+    codes = numpy_backend.encode_text(text)
+    strategy = make_strategy(double_hash)
+    rng = np.random.default_rng(0)
+    csv_data = []
+
+    for m in window_lengths:
+        hashes = numpy_backend.window_hashes(strategy, codes, m)
+
+        # Словарь списков: вся оставшаяся после построения память (int хешей, списки, позиции, таблица)
+        tracemalloc.start()
+        table = dict_of_lists(hashes.tolist())
+        dict_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        store = WindowHashStore(hashes)
+
+        queries = rng.choice(hashes, queries_count // 2).tolist()
+        queries += rng.integers(0, 2 ** 62, queries_count - len(queries)).tolist()
+
+        start_time = time.perf_counter_ns()
+        found_dict = sum(1 for h in queries if h in table)
+        dict_lookup_ns = (time.perf_counter_ns() - start_time) / len(queries)
+
+        start_time = time.perf_counter_ns()
+        found_store = sum(1 for h in queries if h in store)
+        store_lookup_ns = (time.perf_counter_ns() - start_time) / len(queries)
+        assert found_dict == found_store
+
+        dict_per_window = dict_bytes / len(hashes)
+        store_per_window = store.bytes_per_window()
+        csv_data.append([m, len(hashes), store.distinct, dict_per_window, store_per_window,
+                         dict_per_window / store_per_window, dict_lookup_ns, store_lookup_ns])
+        print(f"m={m:3d} | окон {len(hashes)} | различных {store.distinct} | "
+              f"словарь {dict_per_window:6.1f} Б/окно | хранилище {store_per_window:5.1f} Б/окно | "
+              f"x{dict_per_window / store_per_window:.1f}")
+        del table
+
+    csv_filename = save_to_csv(csv_data)
+    print(f"CSV данные для графиков: {csv_filename}")
+    print("РАБОТА ПО СОЗДАНИЮ МЕТРИК HASH STORE ОКОНЧЕНА УСПЕШНО")
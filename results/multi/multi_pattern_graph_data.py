@@ -0,0 +1,104 @@
+import csv
+import os
+
+from src.chetsum_hash import chetsum_hash
+from src.double_hash import double_hash
+from src.first_last_hash import first_last_hash
+from src.hash_simple import simple_hash
+from src.lite_crc32 import rolling_crc32
+from src.multi_pattern import MultiPatternRabinKarp
+from src.rabin_karp import RabinKarp
+from src.text_cache import load_text
+
+multi_file_name = "alice.txt"
+
+
+def save_to_csv(data, filename=f"results/multi/multi_pattern_graph_data_{multi_file_name[:-4]}.csv"):
+    with open(filename, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+
+        # Заголовки CSV
+        writer.writerow([
+            'hash_function',
+            'patterns_count',
+            'engine',
+            'time_ms',
+            'collisions',
+            'checks',
+            'matches'
+        ])
+
+        for row in data:
+            writer.writerow(row)
+
+    return filename
+
+
+def create_multi_pattern_metrics():
+    ##############################################################
+    # ИЗМЕНЯЕМЫЕ ПАРАМЕТРЫ
+
+    # Количество паттернов (слов из текста)
+    patterns_counts = [1, 5, 10, 25, 50, 100]
+
+    # Хеш-функции с именами
+    hash_functions = [
+        ("simple_hash", simple_hash),
+        ("first_last_hash", first_last_hash),
+        ("chetsum_hash", chetsum_hash),
+        ("rolling_crc32", rolling_crc32),
+        ("double_hash", double_hash),
+    ]
+    ##############################################################
+
+    path_to_file = f"texts/{multi_file_name}"
+    if not os.path.exists(path_to_file):
+        print(f"Файл {path_to_file} не найден!")
+        return
+
+    text = load_text(path_to_file)
+    if not text:
+        print("Ошибка: не удалось загрузить текст")
+        return
+
+    print("=" * 70)
+    print("ТЕСТИРОВАНИЕ МНОГОШАБЛОННОГО ПОИСКА")
+    print(f"Файл: {path_to_file}")
+    print(f"Длина текста: {len(text)} символов")
+
+    # Слова-паттерны разной длины из начала текста
+    words = []
+    for word in text[:20000].split():
+        if len(word) > 2 and word not in words:
+            words.append(word)
+
+    csv_data = []
+
+    for patterns_count in patterns_counts:
+        patterns = words[:patterns_count]
+
+        for hash_name, hash_func in hash_functions:
+            # N отдельных вызовов find
+            algorithm = RabinKarp(hash_func, hash_name=hash_name)
+            time_ms = collisions = checks = matches = 0
+            for pattern in patterns:
+                matches += algorithm.count(pattern, text)
+                stats = algorithm.get_stats()
+                time_ms += stats['time_ms']
+                collisions += stats['collisions']
+                checks += stats['checks']
+            csv_data.append([hash_name, len(patterns), 'rabin_karp', time_ms, collisions, checks, matches])
+
+            # Один проход на каждую длину
+            multi = MultiPatternRabinKarp(hash_func, patterns, hash_name=hash_name)
+            matches = len(multi.findall(text))
+            stats = multi.get_stats()
+            csv_data.append([hash_name, len(patterns), 'multi_pattern',
+                             stats['time_ms'], stats['collisions'], stats['checks'], matches])
+
+    if csv_data:
+        csv_filename = save_to_csv(csv_data)
+        print(f"CSV данные для графиков: {csv_filename}")
+        print("РАБОТА ПО СОЗДАНИЮ МЕТРИК MULTI PATTERN ОКОНЧЕНА УСПЕШНО")
+    else:
+        print("Ошибка: не собраны данные для сохранения")
@@ -0,0 +1,83 @@
+import csv
+import os
+
+from src.double_hash import double_hash
+from src.parallel_search import ParallelRabinKarp
+from src.rabin_karp import RabinKarp
+from src.text_cache import load_text
+
+parallel_file_name = "war_and_peace.txt"
+
+
+def save_to_csv(data, filename=f"results/parallel/parallel_graph_data_{parallel_file_name[:-4]}.csv"):
+    with open(filename, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+
+        # Заголовки CSV
+        writer.writerow([
+            'workers',
+            'text_length',
+            'time_ms',
+            'setup_ms',
+            'speedup',
+            'collisions',
+            'checks',
+            'matches'
+        ])
+
+        for row in data:
+            writer.writerow(row)
+
+    return filename
+
+
+def create_parallel_metrics():
+    ##############################################################
+    # ИЗМЕНЯЕМЫЕ ПАРАМЕТРЫ
+
+    # Количество процессов
+    workers_list = [1, 2, 4, 8]
+
+    # Текст повторяется, чтобы получить >= 10 МБ
+    text_repeats = 4
+
+    pattern = "Наташа"
+    ##############################################################
+
+    path_to_file = f"texts/{parallel_file_name}"
+    if not os.path.exists(path_to_file):
+        print(f"Файл {path_to_file} не найден!")
+        return
+
+    text = load_text(path_to_file)
+    if not text:
+        print("Ошибка: не удалось загрузить текст")
+        return
+    text = text * text_repeats
+
+    print("=" * 70)
+    print("ТЕСТИРОВАНИЕ ПАРАЛЛЕЛЬНОГО ПОИСКА")
+    print(f"Файл: {path_to_file} x{text_repeats}")
+    print(f"Длина текста: {len(text)} символов")
+
+    # Последовательный поиск - точка отсчёта
+    algorithm = RabinKarp(double_hash)
+    matches = algorithm.count(pattern, text)
+    serial = algorithm.get_stats()
+
+    # Время параллельного поиска - весь вызов, включая подготовку текста (setup_ms) и запуск пула
+    csv_data = [[0, len(text), serial['time_ms'], 0.0, 1.0, serial['collisions'], serial['checks'], matches]]
+
+    for workers in workers_list:
+        parallel = ParallelRabinKarp(double_hash, workers=workers)
+        matches = len(parallel.findall(pattern, text))
+        stats = parallel.get_stats()
+        speedup = serial['time_ms'] / stats['time_ms'] if stats['time_ms'] else 0
+        csv_data.append([workers, len(text), stats['time_ms'], stats['setup_ms'], speedup,
+                         stats['collisions'], stats['checks'], matches])
+        print(f"Процессов: {workers:2d} | {stats['time_ms']:10.1f} мс "
+              f"(подготовка {stats['setup_ms']:.1f} мс) | ускорение x{speedup:.2f}")
+
+    csv_filename = save_to_csv(csv_data)
+    print(f"CSV данные для графиков: {csv_filename}")
+    print("РАБОТА ПО СОЗДАНИЮ МЕТРИК PARALLEL ОКОНЧЕНА УСПЕШНО")
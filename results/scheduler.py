@@ -0,0 +1,182 @@
+"""
+ПАРАЛЛЕЛЬНЫЙ ПЛАНИРОВЩИК БЕНЧМАРКОВ
+
+Эксперименты описаны в results/experiments.json. Сетка текст x хеш-функция
+x длина паттерна x повтор разворачивается в отдельные задачи; эксперименты
+с одинаковым источником паттерна (collizion и checks) делят одни и те же
+замеры. Задачи выполняются на пуле процессов, каждый воркер при старте
+закрепляется за своим ядром (os.sched_setaffinity), чтобы замеры соседних
+задач не мешали друг другу. Тексты воркеры читают через src.text_cache,
+поэтому в задачу передаётся только имя файла, а корпус декодируется
+один раз на процесс.
+
+Кроме хеш-функций эксперимент может сравнивать другие движки (engines,
+например suffix_array): движок строится по тексту один раз на воркер,
+замеряется только запрос.
+
+Из слитых результатов для каждого текста пишутся CSV прежних схем
+(time / collizion / checks), текстовые сводки и строятся графики.
+time_ms - медиана по повторам, счётчики детерминированы и берутся из
+любого повтора.
+"""
+import gc
+import json
+import multiprocessing
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib.pyplot as plt
+
+from results.checks import checks_graph_data
+from results.collizion import collizion_graph_data
+from results.experiments import ENGINES, HASH_FUNCTIONS, load_config, make_pattern, pattern_key
+from results.graphics import create_time_graphs, create_collizion_graphs, create_checks_graphs
+from results.time import time_graph_data
+from src.rabin_karp import RabinKarp
+from src.text_cache import load_text
+
+# Эксперимент -> (запись CSV, запись сводки, график, путь CSV, путь сводки,
+#                  схема со столбцами pattern / total_windows)
+OUTPUTS = {
+    "time": (time_graph_data.save_to_csv, time_graph_data.save_summary_to_txt, create_time_graphs,
+             "results/time/time_graph_data_{stem}.csv", "results/time/time_summary_{stem}.txt", False),
+    "collizion": (collizion_graph_data.save_to_csv, collizion_graph_data.save_summary_to_txt,
+                  create_collizion_graphs, "results/collizion/collision_graph_data_{stem}.csv",
+                  "results/collizion/collision_graph_summary_{stem}.txt", True),
+    "checks": (checks_graph_data.save_to_csv, checks_graph_data.save_summary_to_txt, create_checks_graphs,
+               "results/checks/checks_graph_data_{stem}.csv", "results/checks/checks_graph_summary_{stem}.txt", True),
+}
+
+# Движки, уже построенные в этом воркере: (имя, путь) -> движок
+_engines = {}
+
+
+def _pin_worker(counter, cpus: list):
+    # Инициализатор воркера: следующее по счётчику ядро из доступных
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    if hasattr(os, "sched_setaffinity") and cpus:
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+
+def _engine(name: str, path: str, text: str):
+    # Построение движка (суффиксного массива) не входит в замер запроса
+    key = (name, path)
+    if key not in _engines:
+        _engines[key] = ENGINES[name](text)
+    return _engines[key]
+
+
+def _run_task(task: tuple) -> tuple:
+    """
+    Один замер: (источник паттерна, путь, хеш-функция или движок, длина, повтор)
+    -> (задача, статистика, позиция)
+    """
+    source, path, hash_name, length, _ = task
+    text = load_text(path)
+    pattern = make_pattern(json.loads(source), text, length)
+    if hash_name in ENGINES:
+        algorithm = _engine(hash_name, path, text)
+        search = lambda: algorithm.find(pattern)
+    else:
+        algorithm = RabinKarp(HASH_FUNCTIONS[hash_name], hash_name=hash_name)
+        search = lambda: algorithm.find(pattern, text)
+
+    gc.disable()
+    try:
+        position = search()
+    finally:
+        gc.enable()
+    return task, algorithm.get_stats(), position
+
+
+def build_tasks(config: dict) -> list:
+    # Объединённая сетка всех экспериментов: общие замеры не дублируются,
+    # число повторов - наибольшее из запрошенных
+    repeats = {}
+    for experiment in config["experiments"].values():
+        source = pattern_key(experiment["pattern"])
+        for file_name in experiment["texts"]:
+            path = os.path.join(config["texts_dir"], file_name)
+            n = len(load_text(path))
+            for length in experiment["lengths"]:
+                if length > n:
+                    continue
+                for hash_name in experiment["hashes"] + experiment["engines"]:
+                    key = (source, path, hash_name, length)
+                    repeats[key] = max(repeats.get(key, 0), experiment["repeats"])
+
+    # Длинные тексты - первыми, чтобы пул не простаивал в конце
+    keys = sorted(repeats, key=lambda key: os.path.getsize(key[1]), reverse=True)
+    return [(*key, repetition) for key in keys for repetition in range(repeats[key])]
+
+
+def run_tasks(tasks: list, workers: int = None) -> dict:
+    """Выполняет задачи на пуле; результаты сгруппированы по задаче без номера повтора"""
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+    workers = workers or len(cpus) or os.cpu_count() or 1
+    counter = multiprocessing.Value("i", 0)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_pin_worker, initargs=(counter, cpus)) as pool:
+        futures = [pool.submit(_run_task, task) for task in tasks]
+        for done, future in enumerate(as_completed(futures), 1):
+            task, stats, position = future.result()
+            results.setdefault(task[:4], []).append((stats, position))
+            if done % 500 == 0 or done == len(futures):
+                print(f"Выполнено задач: {done}/{len(futures)}")
+    return results
+
+
+def _rows(results: dict, experiment: dict, path: str, with_windows: bool) -> list:
+    # Строки CSV прежних схем; time_ms - медиана по повторам
+    source = pattern_key(experiment["pattern"])
+    text = load_text(path)
+    rows = []
+    for length in experiment["lengths"]:
+        for hash_name in experiment["hashes"] + experiment["engines"]:
+            samples = results.get((source, path, hash_name, length))
+            if not samples:
+                continue
+            stats, position = samples[0]
+            time_ms = statistics.median(s['time_ms'] for s, _ in samples)
+            if with_windows:
+                rows.append([hash_name, length, make_pattern(experiment["pattern"], text, length), time_ms,
+                             stats['collisions'], stats['checks'], len(text) - length + 1,
+                             position != -1, position])
+            else:
+                rows.append([hash_name, length, time_ms, stats['collisions'], stats['checks'],
+                             position != -1, position])
+    return rows
+
+
+def write_results(results: dict, config: dict):
+    """CSV, сводка и график каждого эксперимента для каждого его текста"""
+    for name, experiment in config["experiments"].items():
+        save_to_csv, save_summary, create_graph, csv_path, summary_path, with_windows = OUTPUTS[name]
+        for file_name in experiment["texts"]:
+            path = os.path.join(config["texts_dir"], file_name)
+            rows = _rows(results, experiment, path, with_windows)
+            csv_file = save_to_csv(rows, csv_path.format(stem=file_name[:-4]))
+            save_summary(rows, summary_path.format(stem=file_name[:-4]))
+            create_graph(csv_file, file_name)
+            plt.close("all")
+        print(f"CSV, сводки и графики {name} сохранены")
+
+
+def run_benchmarks(config_path: str = None, workers: int = None):
+    config = load_config(config_path) if config_path else load_config()
+    unknown = [name for name in config["experiments"] if name not in OUTPUTS]
+    if unknown:
+        raise ValueError(f"Нет вывода для экспериментов {unknown}")
+
+    start_time = time.perf_counter()
+    tasks = build_tasks(config)
+    print("=" * 70)
+    print(f"Эксперименты: {', '.join(config['experiments'])} | задач: {len(tasks)}")
+    results = run_tasks(tasks, workers)
+    write_results(results, config)
+    print(f"ВСЕ БЕНЧМАРКИ ВЫПОЛНЕНЫ ЗА {time.perf_counter() - start_time:.1f} с")
@@ -0,0 +1,76 @@
+import csv
+import os
+import statistics
+
+from src.double_hash import double_hash
+from src.rabin_karp import RabinKarp
+from src.suffix_array import SUFFIX_ARRAY_BUILD_PASSES, SuffixArraySearch
+from src.text_cache import load_text
+
+suffix_array_file_names = ["alice.txt", "dna.txt", "rabin_karp.txt", "stih.txt", "war_and_peace.txt"]
+
+
+def save_to_csv(data, filename="results/suffix_array/suffix_array_graph_data.csv"):
+    with open(filename, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+
+        # Заголовки CSV
+        writer.writerow([
+            'text',
+            'text_length',
+            'build_ms',
+            'pass_ms',
+            'build_passes'
+        ])
+
+        for row in data:
+            writer.writerow(row)
+
+    return filename
+
+
+def create_suffix_array_metrics():
+    ##############################################################
+    # ИЗМЕНЯЕМЫЕ ПАРАМЕТРЫ
+
+    # Повторы замера (берётся медиана)
+    repeats = 3
+
+    # Паттерн, которого нет в текстах: проход RabinKarp идёт до конца
+    pattern = "\x00нет"
+    ##############################################################
+
+    print("=" * 70)
+    print("ПОСТРОЕНИЕ СУФФИКСНОГО МАССИВА В ПРОХОДАХ RabinKarp (double_hash)")
+
+    csv_data = []
+    for file_name in suffix_array_file_names:
+        path_to_file = f"texts/{file_name}"
+        if not os.path.exists(path_to_file):
+            print(f"Файл {path_to_file} не найден!")
+            continue
+        text = load_text(path_to_file)
+
+        builds, passes = [], []
+        for _ in range(repeats):
+            builds.append(SuffixArraySearch(text).build_time_ns)
+            algorithm = RabinKarp(double_hash)
+            algorithm.count(pattern, text)
+            passes.append(algorithm.time_ns)
+
+        build_ms = statistics.median(builds) / 1_000_000
+        pass_ms = statistics.median(passes) / 1_000_000
+        csv_data.append([file_name, len(text), build_ms, pass_ms, build_ms / pass_ms])
+        print(f"{file_name:20} | {len(text):8d} символов | построение {build_ms:8.1f} мс | "
+              f"проход {pass_ms:7.1f} мс | x{build_ms / pass_ms:.2f}")
+
+    if not csv_data:
+        print("Ошибка: не собраны данные для сохранения")
+        return
+
+    median_passes = statistics.median(row[4] for row in csv_data)
+    print(f"Медиана: {median_passes:.2f} прохода (SUFFIX_ARRAY_BUILD_PASSES = {SUFFIX_ARRAY_BUILD_PASSES})")
+
+    csv_filename = save_to_csv(csv_data)
+    print(f"CSV данные для графиков: {csv_filename}")
+    print("РАБОТА ПО СОЗДАНИЮ МЕТРИК SUFFIX ARRAY ОКОНЧЕНА УСПЕШНО")
@@ -0,0 +1,89 @@
+import csv
+import os
+import time
+
+from src.text_cache import load_text
+from src.winnowing import WinnowingDetector
+
+winnowing_file_names = ["alice.txt", "dna.txt", "rabin_karp.txt", "stih.txt", "war_and_peace.txt"]
+
+
+def save_to_csv(data, filename="results/winnowing/winnowing_graph_data.csv"):
+    with open(filename, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+
+        # Заголовки CSV
+        writer.writerow([
+            'fraction',
+            'documents',
+            'total_chars',
+            'fingerprints',
+            'fingerprint_ms',
+            'join_ms',
+            'time_ms',
+            'collisions',
+            'checks',
+            'regions',
+            'shared_chars'
+        ])
+
+        for row in data:
+            writer.writerow(row)
+
+    return filename
+
+
+def create_winnowing_metrics():
+    ##############################################################
+    # ИЗМЕНЯЕМЫЕ ПАРАМЕТРЫ
+
+    # Доля каждого документа (префикс): рост корпуса при тех же документах
+    fractions = [0.125, 0.25, 0.5, 1.0]
+
+    # Длина окна и размер группы winnowing
+    k = 50
+    w = 30
+    ##############################################################
+
+    texts = {}
+    for file_name in winnowing_file_names:
+        path_to_file = f"texts/{file_name}"
+        if not os.path.exists(path_to_file):
+            print(f"Файл {path_to_file} не найден!")
+            continue
+        text = load_text(path_to_file)
+        if text:
+            texts[file_name] = text
+
+    if len(texts) < 2:
+        print("Ошибка: нужно хотя бы два документа")
+        return
+
+    print("=" * 70)
+    print("ТЕСТИРОВАНИЕ ПОИСКА ОБЩИХ ФРАГМЕНТОВ (WINNOWING)")
+    print(f"Документы: {', '.join(texts)}")
+
+    csv_data = []
+
+    for fraction in fractions:
+        documents = {name: text[:int(len(text) * fraction)] for name, text in texts.items()}
+        total_chars = sum(len(text) for text in documents.values())
+
+        detector = WinnowingDetector(k=k, w=w)
+        start_time = time.perf_counter_ns()
+        for name, text in documents.items():
+            detector.add(name, text)
+        regions = detector.shared_regions()
+        time_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+
+        stats = detector.get_stats()
+        shared_chars = sum(region.length for region in regions)
+        csv_data.append([fraction, len(documents), total_chars, stats['fingerprints'], stats['fingerprint_ms'],
+                         stats['time_ms'], time_ms, stats['collisions'], stats['checks'],
+                         len(regions), shared_chars])
+        print(f"Доля {fraction:5.3f} | {total_chars:9d} символов | {time_ms:8.1f} мс | "
+              f"отпечатков {stats['fingerprints']:7d} | фрагментов {len(regions)}")
+
+    csv_filename = save_to_csv(csv_data)
+    print(f"CSV данные для графиков: {csv_filename}")
+    print("РАБОТА ПО СОЗДАНИЮ МЕТРИК WINNOWING ОКОНЧЕНА УСПЕШНО")
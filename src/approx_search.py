@@ -0,0 +1,42 @@
+"""
+ПОИСК С НЕСОВПАДЕНИЯМИ: RabinKarp.finditer_approx(pattern, text, k)
+
+Ищутся окна, отличающиеся от паттерна не более чем в k позициях (расстояние
+Хэмминга, только замены). Принцип Дирихле: паттерн режется на k + 1 кусков,
+и при <= k заменах хотя бы один кусок входит в окно без изменений.
+Куски имеют длины q и q + 1 и ищутся точно за один проход скользящим хешем
+окон длины q (длинные куски - по префиксу длины q, затем целиком). Каждое
+вхождение куска даёт кандидата - начало окна, которое проверяется
+ограниченным сравнением (стоп после k + 1 несовпадения).
+"""
+
+
+def split_pieces(pattern, k: int) -> list:
+    """[(смещение, кусок)] - k + 1 кусков почти равной длины (короткие - первыми)"""
+    m = len(pattern)
+    short, longer = divmod(m, k + 1)
+    pieces = []
+    offset = 0
+    for index in range(k + 1):
+        length = short + (index >= k + 1 - longer)
+        pieces.append((offset, pattern[offset:offset + length]))
+        offset += length
+    return pieces
+
+
+def make_hamming_verifier(pattern, text, k: int):
+    """
+    verify(i) -> (окно text[i:i + m] отличается не более чем в k позициях,
+    число сравнённых символов). Сравнение прекращается на k + 1 несовпадении.
+    """
+    m = len(pattern)
+
+    def verify(i: int) -> tuple:
+        mismatches = 0
+        for j, (a, b) in enumerate(zip(pattern, text[i:i + m])):
+            if a != b:
+                mismatches += 1
+                if mismatches > k:
+                    return False, j + 1
+        return True, m
+    return verify
@@ -0,0 +1,127 @@
+"""
+АВТОВЫБОР ХЕШ-ФУНКЦИИ: RabinKarp("auto")
+
+По выборке текста оценивается распределение символов, по нему и длине
+паттерна - ожидаемая доля окон-коллизий для каждой хеш-функции (модель
+независимых символов):
+- first_last_hash: совпадение суммы двух символов (точная свёртка);
+- simple_hash / chetsum_hash: совпадение сумм m (ceil(m/2)) символов,
+  нормальное приближение 1 / sqrt(4 pi k sigma^2);
+- double_hash: ~1 / (M1 * M2).
+Берётся самая дешёвая функция (по стоимости шага скольжения), у которой
+оценка не выше target_rate. rolling_crc32 в кандидатах нет: в этой
+реализации он медленнее double_hash при худшей стойкости.
+
+Реальный текст не состоит из независимых символов (анаграммы, повторы),
+поэтому текст проходится сегментами по SEGMENT_WINDOWS окон: если в
+сегменте коллизий больше бюджета (target_rate * окна, не меньше
+MIN_COLLISION_BUDGET), поиск продолжается с более стойкой функцией.
+"""
+import math
+from collections import Counter
+
+from src.chetsum_hash import chetsum_hash
+from src.double_hash import double_hash, M1, M2
+from src.first_last_hash import first_last_hash
+from src.hash_simple import simple_hash
+
+# (имя, функция, относительная стоимость шага) - по возрастанию стоимости;
+# стоимость - время прохода по war_and_peace.txt относительно simple_hash
+CANDIDATES = [
+    ("simple_hash", simple_hash, 1.0),
+    ("chetsum_hash", chetsum_hash, 1.0),
+    ("first_last_hash", first_last_hash, 1.3),
+    ("double_hash", double_hash, 2.6),
+]
+
+TARGET_COLLISION_RATE = 1e-3
+SAMPLE_SIZE = 1 << 16
+SAMPLE_BLOCKS = 16
+SEGMENT_WINDOWS = 1 << 16
+MIN_COLLISION_BUDGET = 16
+
+
+def sample_distribution(text, sample_size: int = SAMPLE_SIZE, blocks: int = SAMPLE_BLOCKS) -> dict:
+    """Код символа -> доля в выборке (blocks равномерно разнесённых кусков текста)"""
+    n = len(text)
+    if n <= sample_size:
+        parts = [text]
+    else:
+        block = sample_size // blocks
+        step = (n - block) // (blocks - 1)
+        parts = [text[k * step:k * step + block] for k in range(blocks)]
+
+    counts = Counter()
+    for part in parts:
+        counts.update(part if not isinstance(part, str) else map(ord, part))
+    total = sum(counts.values())
+    return {code: count / total for code, count in counts.items()}
+
+
+def _sum_collision_rate(probs: dict, k: int) -> float:
+    # P(сумма k кодов окна == сумма k кодов паттерна)
+    mean = sum(code * p for code, p in probs.items())
+    variance = sum((code - mean) ** 2 * p for code, p in probs.items())
+    if k == 1:
+        return sum(p * p for p in probs.values())
+    if variance == 0:
+        return 1.0
+    return min(1.0, 1 / math.sqrt(4 * math.pi * k * variance))
+
+
+def expected_collision_rate(name: str, probs: dict, m: int) -> float:
+    """Ожидаемая доля окон, чей хеш совпадает с хешем паттерна, а само окно - нет"""
+    if name == "double_hash":
+        return 1 / (M1 * M2)
+
+    if name == "simple_hash":
+        same_hash = _sum_collision_rate(probs, m)
+    elif name == "chetsum_hash":
+        same_hash = _sum_collision_rate(probs, (m + 1) // 2)
+    elif name == "first_last_hash":
+        if m == 1:
+            return 0.0
+        pair_sums = Counter()
+        for a, pa in probs.items():
+            for b, pb in probs.items():
+                pair_sums[a + b] += pa * pb
+        same_hash = sum(p * p for p in pair_sums.values())
+    else:
+        raise ValueError(f"Нет модели коллизий для {name}")
+
+    # Настоящие совпадения окна с паттерном - не коллизии
+    same_window = sum(p * p for p in probs.values()) ** m
+    return max(0.0, same_hash - same_window)
+
+
+class AutoSelector:
+    """Выбор и смена хеш-функции для RabinKarp("auto")"""
+
+    def __init__(self, target_rate: float = TARGET_COLLISION_RATE):
+        self.target_rate = target_rate
+
+    def choose(self, text, m: int) -> tuple:
+        """(индекс в CANDIDATES, оценки долей коллизий, причина выбора)"""
+        probs = sample_distribution(text)
+        rates = [expected_collision_rate(name, probs, m) for name, _, _ in CANDIDATES]
+
+        rejected = []
+        for index, (name, _, _) in enumerate(CANDIDATES):
+            if rates[index] <= self.target_rate or index == len(CANDIDATES) - 1:
+                reason = (f"алфавит выборки {len(probs)} симв., m={m}: {name} - оценка доли коллизий "
+                          f"{rates[index]:.1e} <= {self.target_rate:.0e}")
+                if rejected:
+                    reason += "; дешевле, но слабее: " + ", ".join(rejected)
+                return index, rates, reason
+            rejected.append(f"{name} {rates[index]:.1e}")
+
+    def budget(self, windows: int) -> int:
+        # Допустимое число коллизий в сегменте из windows окон
+        return max(MIN_COLLISION_BUDGET, int(self.target_rate * windows))
+
+    def stronger(self, index: int, rates: list) -> int:
+        # Следующая по стоимости функция с меньшей оценкой; в конце - double_hash
+        for candidate in range(index + 1, len(CANDIDATES)):
+            if rates[candidate] < rates[index]:
+                return candidate
+        return len(CANDIDATES) - 1
@@ -1,7 +1,43 @@
+from src.hash_strategy import HashStrategy, char_codes
+
+
 def chetsum_hash(s: str, p: int = 31, m: int = 10 ** 9 + 7) -> int:
     name = "ChetSum_Hash"
     """Только символы на чётных позициях"""
     h = 0
-    for i in range(0, len(s), 2):
-        h += ord(s[i])
+    for code in char_codes(s[::2]):
+        h += code
     return h
+
+
+class ChetSumHashStrategy(HashStrategy):
+    """
+    Скользящий chetsum_hash.
+    При сдвиге окна на 1 чётные позиции становятся нечётными, поэтому
+    кроме самого хеша (сумма на чётных) храним сумму на нечётных позициях.
+    Она живёт в roll, который возвращает init: у каждого прохода своя.
+    """
+    name = "chetsum_hash"
+    can_roll = True
+
+    def __init__(self):
+        super().__init__(chetsum_hash)
+
+    def prepare(self, m: int) -> tuple:
+        # Входящий символ встаёт на позицию m-1
+        return ((m - 1) % 2 == 0,)
+
+    def init(self, window: str, constants: tuple = None) -> tuple:
+        (tail_even,) = constants or self.prepare(len(window))
+        odd_sum = sum(char_codes(window[1::2]))
+
+        def roll(h: int, out_code: int, in_code: int) -> int:
+            nonlocal odd_sum
+            even_sum = odd_sum
+            if tail_even:
+                odd_sum = h - out_code
+                return even_sum + in_code
+            odd_sum = h - out_code + in_code
+            return even_sum
+
+        return chetsum_hash(window), roll
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from src.double_hash import double_hash
+from src.strategies import make_strategy
+
+# Сколько скомпилированных паттернов держит LRU-кеш строкового API
+CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    """
+    СКОМПИЛИРОВАННЫЙ ПАТТЕРН
+
+    Хеш паттерна и константы скольжения (степени, таблицы CRC) считаются
+    один раз и переиспользуются во всех поисках. Хранятся обе формы:
+    str (для поиска в str) и байты utf-8 (для bytes / memoryview / mmap).
+    """
+    strategy_key: tuple
+    pattern: str            # None, если паттерн задан байтами
+    hash: int
+    constants: tuple
+    encoded: bytes
+    encoded_hash: int
+    encoded_constants: tuple
+
+    def for_text(self, text) -> tuple:
+        # (паттерн, хеш, константы) в форме, подходящей к типу текста
+        if isinstance(text, str):
+            if self.pattern is None:
+                raise TypeError("Паттерн из байтов нельзя искать в str")
+            return self.pattern, self.hash, self.constants
+        return self.encoded, self.encoded_hash, self.encoded_constants
+
+    def __len__(self) -> int:
+        return len(self.encoded if self.pattern is None else self.pattern)
+
+
+def compile(pattern, hash_strategy=double_hash) -> CompiledPattern:
+    """Компилирует паттерн (str или байты) под стратегию или функцию хеширования"""
+    strategy = make_strategy(hash_strategy)
+
+    def prepared(p) -> tuple:
+        if p is None:
+            return None, ()
+        return strategy(p), (strategy.prepare(len(p)) if p else ())
+
+    if isinstance(pattern, str):
+        text_form = pattern
+        encoded = pattern.encode("utf-8")
+    else:
+        text_form = None
+        encoded = bytes(pattern)
+
+    pattern_hash, constants = prepared(text_form)
+    encoded_hash, encoded_constants = prepared(encoded)
+    return CompiledPattern(strategy.key(), text_form, pattern_hash, constants,
+                           encoded, encoded_hash, encoded_constants)
+
+
+_cache = OrderedDict()
+
+
+def compile_cached(pattern, strategy) -> CompiledPattern:
+    # Ограниченный LRU-кеш по (паттерн, стратегия) для строкового API
+    if not isinstance(pattern, str):
+        pattern = bytes(pattern)
+    key = (pattern, strategy.key())
+    compiled = _cache.get(key)
+    if compiled is not None:
+        _cache.move_to_end(key)
+        return compiled
+
+    compiled = compile(pattern, strategy)
+    _cache[key] = compiled
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return compiled
+
+
+def clear_cache():
+    _cache.clear()
@@ -0,0 +1,72 @@
+from src.double_hash import P1, M1, P2, M2
+from src.hash_strategy import HashStrategy, char_codes
+
+# 2-битные коды оснований (строчные - как заглавные); прочие символы -> 0,
+# такие окна отсеивает посимвольная проверка
+BASE_CODES = {ord("A"): 0, ord("C"): 1, ord("G"): 2, ord("T"): 3,
+              ord("a"): 0, ord("c"): 1, ord("g"): 2, ord("t"): 3}
+
+# До этой длины k-мер целиком помещается в 64 бита
+EXACT_K = 32
+
+
+def dna_hash(s: str) -> int:
+    name = "DNA_Hash"
+    """
+    ХЕШ ДЛЯ ДНК
+    Каждое основание - 2 бита. Для k <= 32 хеш - сам k-мер как целое
+    (взаимно однозначно: коллизий на A/C/G/T нет). Для длинных паттернов -
+    double_hash (два полинома) по 2-битным кодам: (h1 << 32) | h2.
+    """
+    codes = [BASE_CODES.get(code, 0) for code in char_codes(s)]
+    if len(codes) <= EXACT_K:
+        h = 0
+        for code in codes:
+            h = (h << 2) | code
+        return h
+
+    h1 = 0
+    h2 = 0
+    for code in codes:
+        h1 = (h1 * P1 + code) % M1
+        h2 = (h2 * P2 + code) % M2
+    return (h1 << 32) | h2
+
+
+class DNAHashStrategy(HashStrategy):
+    """
+    Скользящий dna_hash. k <= 32: сдвиг на 2 бита и маска (уходящее основание
+    выпадает само); длиннее - как DoubleHashStrategy по 2-битным кодам.
+    """
+    name = "dna_hash"
+    width = 64
+    can_roll = True
+
+    def __init__(self):
+        super().__init__(dna_hash)
+
+    def prepare(self, m: int) -> tuple:
+        if m <= EXACT_K:
+            return True, (1 << (2 * m)) - 1, 0
+        return False, pow(P1, m - 1, M1), pow(P2, m - 1, M2)
+
+    def init(self, window: str, constants: tuple = None) -> tuple:
+        exact, a, b = constants or self.prepare(len(window))
+        base = BASE_CODES.get
+
+        if exact:
+            mask = a
+
+            def roll(h: int, out_code: int, in_code: int) -> int:
+                return ((h << 2) | base(in_code, 0)) & mask
+        else:
+            p1_pow, p2_pow = a, b
+
+            def roll(h: int, out_code: int, in_code: int) -> int:
+                in_code = base(in_code, 0)
+                out_code = base(out_code, 0)
+                h1 = ((h >> 32) - out_code * p1_pow) * P1 + in_code
+                h2 = ((h & 0xFFFFFFFF) - out_code * p2_pow) * P2 + in_code
+                return ((h1 % M1) << 32) | (h2 % M2)
+
+        return dna_hash(window), roll
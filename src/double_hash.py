@@ -1,3 +1,10 @@
+from src.hash_strategy import HashStrategy, char_codes
+
+# Параметры двух полиномов (нужны и для скользящего пересчёта в RabinKarp)
+P1, M1 = 31, 10 ** 9 + 7
+P2, M2 = 37, 10 ** 9 + 9
+
+
 def double_hash(s: str) -> int:
     name = "Combinbated_double_Hash"
     """
@@ -8,12 +15,36 @@ def double_hash(s: str) -> int:
     """
     h1 = 0
     h2 = 0
-    p1, m1 = 31, 10 ** 9 + 7
-    p2, m2 = 37, 10 ** 9 + 9
+    p1, m1 = P1, M1
+    p2, m2 = P2, M2
 
-    for char in s:
-        code = ord(char)
+    for code in char_codes(s):
         h1 = (h1 * p1 + code) % m1
         h2 = (h2 * p2 + code) % m2
 
-    return (h1 << 32) | h2
\ No newline at end of file
+    return (h1 << 32) | h2
+
+class DoubleHashStrategy(HashStrategy):
+    """
+    Скользящий double_hash: обе половины пересчитываются за O(1).
+    Степени p^(m-1) по каждому модулю считаются один раз в prepare.
+    """
+    name = "double_hash"
+    width = 64
+    can_roll = True
+
+    def __init__(self):
+        super().__init__(double_hash)
+
+    def prepare(self, m: int) -> tuple:
+        return pow(P1, m - 1, M1), pow(P2, m - 1, M2)
+
+    def init(self, window: str, constants: tuple = None) -> tuple:
+        p1_pow, p2_pow = constants or self.prepare(len(window))
+
+        def roll(h: int, out_code: int, in_code: int) -> int:
+            h1 = ((h >> 32) - out_code * p1_pow) * P1 + in_code
+            h2 = ((h & 0xFFFFFFFF) - out_code * p2_pow) * P2 + in_code
+            return ((h1 % M1) << 32) | (h2 % M2)
+
+        return double_hash(window), roll
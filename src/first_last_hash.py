@@ -1,3 +1,6 @@
+from src.hash_strategy import HashStrategy, code_at
+
+
 def first_last_hash(s: str, base: int = 31) -> int:
     name = "First_Last_Hash"
 
@@ -5,4 +8,18 @@ def first_last_hash(s: str, base: int = 31) -> int:
 
     if not s:
         return 0
-    return ord(s[0]) + ord(s[-1])
+    return code_at(s, 0) + code_at(s, -1)
+
+
+class FirstLastHashStrategy(HashStrategy):
+    """
+    first_last_hash зависит только от крайних символов окна:
+    скользить по (уходящий, входящий) нельзя, но окно считается за O(1) без среза.
+    """
+    name = "first_last_hash"
+
+    def __init__(self):
+        super().__init__(first_last_hash)
+
+    def window_hash(self, text: str, i: int, m: int) -> int:
+        return code_at(text, i) + code_at(text, i + m - 1)
@@ -1,3 +1,6 @@
+from src.hash_strategy import HashStrategy, char_codes
+
+
 def simple_hash(s: str) -> int:
     name = "Simple_Hash"
     """
@@ -5,6 +8,18 @@ def simple_hash(s: str) -> int:
     Много коллизий, но простая для понимания.
     """
     h = 0
-    for char in s:
-        h += ord(char)
-    return h
\ No newline at end of file
+    for code in char_codes(s):
+        h += code
+    return h
+
+
+class SimpleHashStrategy(HashStrategy):
+    """Скользящий simple_hash: вычитаем уходящий код, прибавляем входящий"""
+    name = "simple_hash"
+    can_roll = True
+
+    def __init__(self):
+        super().__init__(simple_hash)
+
+    def roll(self, h: int, out_code: int, in_code: int) -> int:
+        return h - out_code + in_code
@@ -0,0 +1,158 @@
+"""
+КОМПАКТНОЕ ХРАНИЛИЩЕ ХЕШЕЙ ОКОН
+
+Словарь хеш -> список позиций хранит каждое окно как несколько объектов
+Python (int хеша, список, int позиции, запись словаря) - порядка сотни
+байт на окно. WindowHashStore держит то же самое в массивах NumPy:
+- keys      - различные хеши по возрастанию (uint32, если все хеши < 2^32, иначе uint64);
+- starts    - границы списков позиций: окна с хешем keys[u] -
+              positions[starts[u]:starts[u + 1]];
+- positions - позиции окон (uint32), сгруппированные по хешу, внутри - по возрастанию;
+- slots     - открытая адресация (линейное пробирование) над keys: номер
+              ключа + 1, 0 - пустой слот; ёмкость - степень двойки,
+              заполнение не выше SLOT_LOAD.
+Проверка хеша и его список позиций - O(1) в среднем. Байт на окно -
+bytes_per_window(); замер против словаря списков на war_and_peace.txt -
+results/hash_store/hash_store_graph_data.py.
+"""
+import numpy as np
+
+from src import numpy_backend
+from src.double_hash import double_hash
+from src.strategies import make_strategy
+
+# Наибольшее заполнение таблицы слотов
+SLOT_LOAD = 0.7
+
+# Мультипликативное хеширование (Фибоначчи): старшие биты произведения - номер слота
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+class WindowHashStore:
+    __slots__ = ("keys", "starts", "positions", "slots", "_bits", "_key_items", "_slot_items")
+
+    def __init__(self, hashes):
+        """hashes - хеши окон по порядку: хеш окна i - hashes[i]"""
+        hashes = np.asarray(hashes)
+        if len(hashes) >= 2 ** 32:
+            raise ValueError("Позиции окон хранятся в uint32: не больше 2^32 окон")
+        key_dtype = np.uint32 if not len(hashes) or int(hashes.max()) < 2 ** 32 else np.uint64
+
+        order = np.argsort(hashes, kind="stable")
+        sorted_hashes = hashes[order].astype(key_dtype)
+        first = np.flatnonzero(np.r_[True, sorted_hashes[1:] != sorted_hashes[:-1]]) if len(hashes) \
+            else np.zeros(0, dtype=np.int64)
+
+        self.keys = sorted_hashes[first]
+        self.starts = np.append(first, len(hashes)).astype(np.uint32)
+        self.positions = order.astype(np.uint32)
+        self._build_slots()
+
+    @classmethod
+    def from_text(cls, text, m: int, hash_func=double_hash) -> "WindowHashStore":
+        """Хеши всех окон длины m текста (векторно, src.numpy_backend)"""
+        strategy = make_strategy(hash_func)
+        if not numpy_backend.supports(strategy):
+            raise ValueError(f"{strategy.name}: нужна векторизуемая хеш-функция")
+        codes = numpy_backend.encode_text(text)
+        if m > len(codes):
+            return cls(np.zeros(0, dtype=np.uint64))
+        return cls(numpy_backend.window_hashes(strategy, codes, m))
+
+    def _home(self, keys: np.ndarray) -> np.ndarray:
+        # Начальные слоты для массива хешей (переполнение uint64 - по модулю 2^64)
+        product = keys.astype(np.uint64) * np.uint64(_MULTIPLIER)
+        return (product >> np.uint64(64 - self._bits)).astype(np.int64)
+
+    def _build_slots(self):
+        # Вставка всех ключей сразу: за раунд каждый свободный слот получает
+        # первый претендент, остальные сдвигаются на следующий слот
+        capacity = 8
+        while capacity * SLOT_LOAD < len(self.keys):
+            capacity *= 2
+        self._bits = capacity.bit_length() - 1
+        self.slots = np.zeros(capacity, dtype=np.uint32)
+
+        pending = np.arange(len(self.keys))
+        slot = self._home(self.keys)
+        while len(pending):
+            free = np.flatnonzero(self.slots[slot] == 0)
+            claimed, first = np.unique(slot[free], return_index=True)
+            self.slots[claimed] = pending[free[first]] + 1
+
+            placed = np.zeros(len(pending), dtype=bool)
+            placed[free[first]] = True
+            pending = pending[~placed]
+            slot = (slot[~placed] + 1) & (capacity - 1)
+
+        # Одиночный поиск читает массивы через memoryview: индекс сразу даёт int, без скаляров NumPy
+        self._key_items = memoryview(self.keys)
+        self._slot_items = memoryview(self.slots)
+
+    def _find(self, h: int) -> int:
+        # Номер ключа h в keys или -1
+        h = int(h)
+        if h < 0 or h > _MASK64:
+            return -1
+        slots, keys = self._slot_items, self._key_items
+        mask = len(slots) - 1
+        slot = ((h * _MULTIPLIER) & _MASK64) >> (64 - self._bits)
+        while True:
+            entry = slots[slot]
+            if not entry:
+                return -1
+            if keys[entry - 1] == h:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def __contains__(self, h: int) -> bool:
+        return self._find(h) >= 0
+
+    def postings(self, h: int) -> np.ndarray:
+        """Позиции окон с хешем h по возрастанию (пустой массив, если хеша нет)"""
+        index = self._find(h)
+        if index < 0:
+            return self.positions[:0]
+        return self.positions[self.starts[index]:self.starts[index + 1]]
+
+    def count(self, h: int) -> int:
+        index = self._find(h)
+        return 0 if index < 0 else int(self.starts[index + 1] - self.starts[index])
+
+    def counts(self, hashes) -> np.ndarray:
+        """Число окон для каждого хеша из массива (поиск всех сразу, векторно)"""
+        hashes = np.asarray(hashes)
+        result = np.zeros(len(hashes), dtype=np.int64)
+        if not len(self.keys):
+            return result
+        # Хеши вне диапазона ключей заведомо отсутствуют
+        active = np.flatnonzero((hashes >= 0) & (hashes <= np.iinfo(self.keys.dtype).max))
+        queries = hashes[active].astype(self.keys.dtype)
+        slot = self._home(queries)
+        mask = len(self.slots) - 1
+        while len(active):
+            entry = self.slots[slot].astype(np.int64)
+            occupied = entry > 0
+            found = occupied & (self.keys[entry - 1] == queries)
+            index = entry[found] - 1
+            result[active[found]] = self.starts[index + 1].astype(np.int64) - self.starts[index]
+
+            keep = occupied & ~found
+            active, queries, slot = active[keep], queries[keep], (slot[keep] + 1) & mask
+        return result
+
+    def __len__(self) -> int:
+        # Число окон
+        return len(self.positions)
+
+    @property
+    def distinct(self) -> int:
+        return len(self.keys)
+
+    @property
+    def nbytes(self) -> int:
+        return self.keys.nbytes + self.starts.nbytes + self.positions.nbytes + self.slots.nbytes
+
+    def bytes_per_window(self) -> float:
+        return self.nbytes / len(self) if len(self) else 0.0
@@ -0,0 +1,110 @@
+def char_codes(s):
+    # Коды символов: ord для str, сами байты для bytes/bytearray/memoryview/mmap
+    if isinstance(s, str):
+        return map(ord, s)
+    if isinstance(s, (bytes, bytearray, memoryview)):
+        return s
+    return memoryview(s)
+
+
+def code_at(s, i: int) -> int:
+    # Код символа на позиции i (для байтовых данных s[i] уже int)
+    c = s[i]
+    return ord(c) if isinstance(c, str) else c
+
+
+class HashStrategy:
+    """
+    СТРАТЕГИЯ ХЕШИРОВАНИЯ ДЛЯ RabinKarp
+
+    prepare(m)                - константы скольжения для длины окна m (степени, таблицы)
+    init(window, constants)   - (хеш первого окна, roll для этого прохода или None);
+                                constants - результат prepare, если уже посчитан
+    roll(h, out_code, in_code) - хеш следующего окна за O(1)
+    window_hash(text, i, m)   - хеш окна text[i:i + m], если скользить нельзя
+    key()                     - идентичность стратегии (для кеша скомпилированных паттернов)
+
+    out_code / in_code - коды уходящего и входящего символов (ord или значение байта).
+    Окна могут быть str или байтовыми (bytes, memoryview, ...).
+    Метаданные: name, width (разрядность хеша в битах), can_roll.
+
+    Константы и состояние скольжения живут в roll, который вернул init, а не в
+    стратегии: один экземпляр можно использовать в нескольких проходах сразу
+    (например, в двух незавершённых finditer).
+    """
+    name = ""
+    width = 32
+    can_roll = False
+    brute_force = False
+
+    def __init__(self, hash_func=None):
+        if hash_func is not None:
+            self.hash_func = hash_func
+
+    def hash_func(self, s: str) -> int:
+        raise NotImplementedError
+
+    def __call__(self, s: str) -> int:
+        return self.hash_func(s)
+
+    def key(self) -> tuple:
+        return (type(self),)
+
+    def prepare(self, m: int) -> tuple:
+        return ()
+
+    def init(self, window: str, constants: tuple = None) -> tuple:
+        return self.hash_func(window), (self.roll if self.can_roll else None)
+
+    def roll(self, h: int, out_code: int, in_code: int) -> int:
+        raise NotImplementedError(f"{self.name}: скользящий пересчёт не поддерживается")
+
+    def window_hash(self, text: str, i: int, m: int) -> int:
+        # Пересчёт с нуля: O(m) на окно
+        return self.hash_func(text[i:i + m])
+
+
+class FunctionStrategy(HashStrategy):
+    """Обёртка над произвольной функцией хеширования (без скольжения)"""
+
+    def __init__(self, hash_func, name: str = ""):
+        super().__init__(hash_func)
+        self.name = name or getattr(hash_func, "name", "") or getattr(hash_func, "__name__", "")
+
+    def key(self) -> tuple:
+        return (type(self), self.hash_func)
+
+
+class PolynomialStrategy(HashStrategy):
+    """Полиномиальный хеш h = sum(s[i] * p^(m-1-i)) mod mod"""
+    name = "polynomial_hash"
+    can_roll = True
+
+    def __init__(self, p: int = 31, mod: int = 10 ** 9 + 7):
+        super().__init__()
+        self.p = p
+        self.mod = mod
+        self.width = mod.bit_length()
+
+    def hash_func(self, s: str) -> int:
+        p, mod = self.p, self.mod
+        h = 0
+        for code in char_codes(s):
+            h = (h * p + code) % mod
+        return h
+
+    def key(self) -> tuple:
+        return (type(self), self.p, self.mod)
+
+    def prepare(self, m: int) -> tuple:
+        # p^(m-1) считается один раз на поиск (или на скомпилированный паттерн)
+        return (pow(self.p, m - 1, self.mod),)
+
+    def init(self, window: str, constants: tuple = None) -> tuple:
+        (p_pow,) = constants or self.prepare(len(window))
+        p, mod = self.p, self.mod
+
+        def roll(h: int, out_code: int, in_code: int) -> int:
+            return ((h - out_code * p_pow) * p + in_code) % mod
+
+        return self.hash_func(window), roll
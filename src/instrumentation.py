@@ -0,0 +1,55 @@
+"""
+ИНСТРУМЕНТИРОВАНИЕ ПОИСКА
+
+Включается через RabinKarp(..., instrument=True) или add_hook(callback).
+Выключенное инструментирование ничего не стоит: RabinKarp выбирает обычные
+циклы, а профилирующие копии (с замером каждой операции) - только при
+включённом. Поэтому сами времена фаз включают накладные расходы таймера
+и сравнимы между собой, но не с time_ns неинструментированного поиска.
+
+Фазы:
+- compile - хеш паттерна и константы скольжения (из кеша - почти 0);
+- init    - хеш первого окна (numpy backend - хеши всех окон сразу);
+- roll    - скользящие обновления хеша;
+- rehash  - пересчёт окна с нуля (хеши без скольжения);
+- verify  - посимвольные проверки кандидатов.
+verify_bytes - верхняя граница сравнённых элементов: m на проверку (для str -
+символы, для bytes - байты); отсев src.verify часто отвергает окно раньше.
+"""
+import json
+from dataclasses import dataclass, field
+
+PHASES = ("compile", "init", "roll", "rehash", "verify")
+
+
+def _zero_phases() -> dict:
+    return dict.fromkeys(PHASES, 0)
+
+
+@dataclass(slots=True)
+class SearchProfile:
+    """Профиль одного прохода поиска"""
+    hash_name: str
+    phase_ns: dict = field(default_factory=_zero_phases)
+    windows_rolled: int = 0
+    windows_rehashed: int = 0
+    verifications: int = 0
+    verify_bytes: int = 0
+
+    def to_dict(self) -> dict:
+        # Плоский словарь: удобно дописывать столбцами в CSV
+        record = {f"{phase}_ns": ns for phase, ns in self.phase_ns.items()}
+        record.update(
+            windows_rolled=self.windows_rolled,
+            windows_rehashed=self.windows_rehashed,
+            verifications=self.verifications,
+            verify_bytes=self.verify_bytes,
+        )
+        return record
+
+    def to_json(self) -> str:
+        return json.dumps({"hash_name": self.hash_name, **self.to_dict()}, ensure_ascii=False)
+
+
+# Столбцы профиля в CSV бенчмарков (в порядке SearchProfile.to_dict)
+PROFILE_COLUMNS = list(SearchProfile("").to_dict())
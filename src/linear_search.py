@@ -1,4 +1,15 @@
+from src.hash_strategy import HashStrategy
+
+
 def linear_search(s: str) -> int:
 
     linear_search.name = "linear_search"
-    return 0
\ No newline at end of file
+    return 0
+
+class LinearSearchStrategy(HashStrategy):
+    """Бейзлайн: хеши не используются, каждое окно сравнивается посимвольно"""
+    name = "linear_search"
+    brute_force = True
+
+    def __init__(self):
+        super().__init__(linear_search)
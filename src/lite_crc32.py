@@ -1,17 +1,112 @@
+from functools import lru_cache
+
+from src.hash_strategy import HashStrategy, char_codes
+
+POLY = 0xEDB88320  # стандартный полином CRC32
+
+
+def _make_table() -> list:
+    # CRC одного байта: те же 8 битовых шагов, но один раз для всех 256 значений
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ POLY
+            else:
+                crc >>= 1
+        table.append(crc)
+    return table
+
+
+CRC_TABLE = _make_table()
+
+
 def rolling_crc32(s: str, crc: int = 0) -> int:
     name = "Lite_CRC32"
     """
     УПРОЩЁННЫЙ CRC32 ДЛЯ СКОЛЬЗЯЩЕГО ХЕШИРОВАНИЯ
+    Табличный вариант: один шаг на символ вместо 8 битовых.
+    Без начального 0xFFFFFFFF и финального XOR, поэтому CRC линеен
+    и окно можно сдвигать за O(1) (см. LiteCRC32Strategy).
+    Связь со стандартным CRC32 (zlib.crc32) для байтов w длины m:
+        rolling_crc32(w, 0xFFFFFFFF) ^ 0xFFFFFFFF == zlib.crc32(w)
+        rolling_crc32(w) == zlib.crc32(w) ^ zlib.crc32(bytes(m))
     """
-    poly = 0xEDB88320  # стандартный полином CRC32
+    table = CRC_TABLE
 
-    for char in s:
-        byte = ord(char)
-        crc ^= byte
-        for _ in range(8):
-            if crc & 1:
-                crc = (crc >> 1) ^ poly
-            else:
-                crc >>= 1
+    for code in char_codes(s):
+        crc ^= code
+        crc = (crc >> 8) ^ table[crc & 0xFF]
+
+    return crc
+
+
+def _apply(images: list, x: int) -> int:
+    # Линейное над GF(2) отображение, заданное образами 32 базисных битов
+    result = 0
+    bit = 0
+    while x:
+        if x & 1:
+            result ^= images[bit]
+        x >>= 1
+        bit += 1
+    return result
+
+
+def _zero_bytes_operator(count: int) -> list:
+    # Образы базисных битов после дописывания count нулевых байт (возведение в степень)
+    step = [(1 << bit >> 8) ^ CRC_TABLE[(1 << bit) & 0xFF] for bit in range(32)]
+    result = [1 << bit for bit in range(32)]
+    while count:
+        if count & 1:
+            result = [_apply(step, v) for v in result]
+        step = [_apply(step, v) for v in step]
+        count >>= 1
+    return result
+
+
+@lru_cache(maxsize=64)
+def _remove_tables(m: int) -> tuple:
+    """
+    Таблицы удаления уходящего символа для окна длины m:
+    out_table[byte] - вклад байта, zero_tables - сдвиг 32-битного значения
+    на m нулевых байт по четырём байтам (для кодов >= 256).
+    """
+    zero = _zero_bytes_operator(m)
+    zero_tables = tuple(tuple(_apply(zero, byte << shift) for byte in range(256))
+                        for shift in (0, 8, 16, 24))
+    t0, t1, t2, t3 = zero_tables
+    out_table = tuple(t0[x & 0xFF] ^ t1[(x >> 8) & 0xFF] ^ t2[(x >> 16) & 0xFF] ^ t3[x >> 24]
+                      for x in CRC_TABLE)
+    return out_table, zero_tables
+
+
+class LiteCRC32Strategy(HashStrategy):
+    """
+    Скользящий rolling_crc32.
+    crc(w[1..m]) = crc(w[0..m]) ^ crc(w[0] + m нулевых байт), последнее слагаемое
+    берётся из таблицы "удаления" уходящего байта, построенной в prepare на длину окна.
+    """
+    name = "rolling_crc32"
+    can_roll = True
+
+    def __init__(self):
+        super().__init__(rolling_crc32)
+
+    def prepare(self, m: int) -> tuple:
+        return _remove_tables(m)
+
+    def init(self, window: str, constants: tuple = None) -> tuple:
+        out_table, (t0, t1, t2, t3) = constants or self.prepare(len(window))
+
+        def roll(h: int, out_code: int, in_code: int) -> int:
+            h ^= in_code
+            h = (h >> 8) ^ CRC_TABLE[h & 0xFF]
+            if out_code < 256:
+                return h ^ out_table[out_code]
+            # Код >= 256: его первый шаг CRC, сдвинутый на m нулевых байт
+            x = (out_code >> 8) ^ CRC_TABLE[out_code & 0xFF]
+            return h ^ t0[x & 0xFF] ^ t1[(x >> 8) & 0xFF] ^ t2[(x >> 16) & 0xFF] ^ t3[x >> 24]
 
-    return crc
\ No newline at end of file
+        return rolling_crc32(window), roll
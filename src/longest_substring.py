@@ -0,0 +1,209 @@
+"""
+САМАЯ ДЛИННАЯ ПОВТОРЯЮЩАЯСЯ / ОБЩАЯ ПОДСТРОКА
+
+Если подстрока длины L повторяется (или есть в обоих текстах), то и любая
+её часть длины L - 1 тоже, поэтому длина ищется удвоением L и бинарным
+поиском. Шаг для длины L: double_hash всех окон длины L (векторно, из
+префиксных массивов двух полиномов - они считаются один раз на текст),
+поиск одинаковых хешей сортировкой и проверка кандидатов сравнением
+окон - ответ точный.
+Для каждого шага в steps: длина, найдено ли, checks / collisions, время и
+memory_bytes - объём массивов шага (хеши окон, порядок сортировки);
+префиксные массивы живут весь поиск - prefix_bytes в get_stats().
+Для файлов (longest_repeated_substring_in_file / longest_common_substring_in_files)
+текст и префиксные массивы берутся из дискового кеша src.text_cache.
+"""
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.double_hash import P1, M1, P2, M2
+from src.numpy_backend import encode_text, polynomial_prefix, polynomial_window_hashes_from_prefix
+from src.search_stats import SearchStats
+from src.text_cache import load_polynomial_arrays, load_text
+
+
+@dataclass(slots=True)
+class SubstringMatch(SearchStats):
+    """Результат: text_a[start_a:start_a + length] == text_b[start_b:start_b + length]"""
+    length: int = 0
+    start_a: int = 0
+    start_b: int = 0
+    steps: list = field(default_factory=list)
+    collisions: int = 0
+    checks: int = 0
+    time_ns: int = 0
+    prefix_bytes: int = 0
+
+    def get_stats(self) -> dict:
+        # Поля RabinKarp.get_stats, префиксные массивы (на весь поиск) и пиковая память шага
+        # (super() без аргументов в dataclass(slots=True) не работает)
+        return {
+            **SearchStats.get_stats(self),
+            "steps": len(self.steps),
+            "prefix_bytes": self.prefix_bytes,
+            "peak_step_bytes": max((step["memory_bytes"] for step in self.steps), default=0),
+        }
+
+
+class _WindowHasher:
+    """double_hash всех окон длины L текста из префиксных массивов (считаются один раз)"""
+
+    def __init__(self, text=None, path: str = None):
+        # path - файл текста: массивы из дискового кеша (mmap), без пересчёта
+        if path is not None:
+            self.arrays = [(load_polynomial_arrays(path, P1, M1), M1), (load_polynomial_arrays(path, P2, M2), M2)]
+        else:
+            codes = encode_text(text)
+            self.arrays = [(polynomial_prefix(codes, P1, M1), M1), (polynomial_prefix(codes, P2, M2), M2)]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(prefix.nbytes + pw.nbytes for (prefix, pw), _ in self.arrays)
+
+    def hashes(self, length: int) -> np.ndarray:
+        (h1, h2) = (polynomial_window_hashes_from_prefix(prefix, pw, length, mod)
+                    for (prefix, pw), mod in self.arrays)
+        return (h1 << 32) | h2
+
+
+def _as_text(text):
+    return text if isinstance(text, str) else bytes(text)
+
+
+def _first_duplicate(text_a, starts_a, text_b, starts_b, length: int, match: SubstringMatch,
+                     repeated: bool = False):
+    # Окна одной группы хешей: первое окно из starts_b, совпадающее с окном из starts_a
+    # (repeated - один текст: проверенные окна b тоже становятся образцами)
+    seen = {}
+    for start in starts_a:
+        seen.setdefault(text_a[start:start + length], start)
+    for start in starts_b:
+        match.checks += 1
+        found = seen.get(text_b[start:start + length])
+        if found is not None:
+            return found, start
+        match.collisions += 1
+        if repeated:
+            seen.setdefault(text_b[start:start + length], start)
+    return None
+
+
+def _repeated_at(text, hasher: _WindowHasher, length: int, match: SubstringMatch, step: dict):
+    hashes = hasher.hashes(length)
+    order = np.argsort(hashes, kind="stable")
+    sorted_hashes = hashes[order]
+    step["memory_bytes"] = hashes.nbytes + order.nbytes + sorted_hashes.nbytes
+
+    # Группы одинаковых хешей из двух и более окон
+    same = np.flatnonzero(sorted_hashes[1:] == sorted_hashes[:-1])
+    group_starts = same[np.r_[True, np.diff(same) > 1]] if len(same) else same
+    for group_start in group_starts.tolist():
+        group_end = group_start + 1
+        while group_end < len(sorted_hashes) and sorted_hashes[group_end] == sorted_hashes[group_start]:
+            group_end += 1
+        members = order[group_start:group_end].tolist()
+        found = _first_duplicate(text, members[:1], text, members[1:], length, match, repeated=True)
+        if found is not None:
+            return found
+    return None
+
+
+def _common_at(text_a, hasher_a, text_b, hasher_b, length: int, match: SubstringMatch, step: dict):
+    hashes_a = hasher_a.hashes(length)
+    hashes_b = hasher_b.hashes(length)
+    order_a = np.argsort(hashes_a, kind="stable")
+    sorted_a = hashes_a[order_a]
+    step["memory_bytes"] = hashes_a.nbytes + hashes_b.nbytes + order_a.nbytes + sorted_a.nbytes
+
+    # Окна b, чей хеш есть среди окон a: бинарный поиск по отсортированным хешам a
+    lo = np.searchsorted(sorted_a, hashes_b, side="left")
+    hi = np.searchsorted(sorted_a, hashes_b, side="right")
+    step["memory_bytes"] += lo.nbytes + hi.nbytes
+    for start_b in np.flatnonzero(hi > lo).tolist():
+        starts_a = order_a[lo[start_b]:hi[start_b]].tolist()
+        found = _first_duplicate(text_a, starts_a, text_b, [start_b], length, match)
+        if found is not None:
+            return found
+    return None
+
+
+def _binary_search(check, max_length: int, match: SubstringMatch) -> SubstringMatch:
+    # Наибольшая L, для которой check(L, step) находит пару окон. Ответ обычно
+    # много меньше длины текста, поэтому верхняя граница ищется удвоением L
+    start_time = time.perf_counter_ns()
+
+    def probe(length: int) -> bool:
+        step_start = time.perf_counter_ns()
+        checks, collisions = match.checks, match.collisions
+        step = {"length": length, "memory_bytes": 0}
+        found = check(length, step)
+        step.update(found=found is not None, checks=match.checks - checks,
+                    collisions=match.collisions - collisions,
+                    time_ms=(time.perf_counter_ns() - step_start) / 1_000_000)
+        match.steps.append(step)
+        if found is not None:
+            match.length, (match.start_a, match.start_b) = length, found
+        return found is not None
+
+    lo, hi = 0, max_length
+    length = 1
+    while length <= max_length:
+        if not probe(length):
+            hi = length - 1
+            break
+        lo = length
+        length *= 2
+
+    while lo < hi:
+        length = (lo + hi + 1) // 2
+        if probe(length):
+            lo = length
+        else:
+            hi = length - 1
+    match.time_ns = time.perf_counter_ns() - start_time
+    return match
+
+
+def _longest_repeated(text, path: str = None) -> SubstringMatch:
+    match = SubstringMatch()
+    if len(text) < 2:
+        return match
+    hasher = _WindowHasher(text, path)
+    match.prefix_bytes = hasher.nbytes
+    return _binary_search(lambda length, step: _repeated_at(text, hasher, length, match, step),
+                          len(text) - 1, match)
+
+
+def _longest_common(text_a, text_b, path_a: str = None, path_b: str = None) -> SubstringMatch:
+    match = SubstringMatch()
+    if not text_a or not text_b:
+        return match
+    hasher_a, hasher_b = _WindowHasher(text_a, path_a), _WindowHasher(text_b, path_b)
+    match.prefix_bytes = hasher_a.nbytes + hasher_b.nbytes
+    return _binary_search(lambda length, step: _common_at(text_a, hasher_a, text_b, hasher_b,
+                                                          length, match, step),
+                          min(len(text_a), len(text_b)), match)
+
+
+def longest_repeated_substring(text) -> SubstringMatch:
+    """
+    Самая длинная подстрока, встречающаяся в тексте дважды (вхождения могут
+    перекрываться): start_a < start_b. Пустой результат - length 0.
+    """
+    return _longest_repeated(_as_text(text))
+
+
+def longest_common_substring(text_a, text_b) -> SubstringMatch:
+    """Самая длинная подстрока, общая для text_a и text_b (оба str или оба bytes)"""
+    return _longest_common(_as_text(text_a), _as_text(text_b))
+
+
+def longest_repeated_substring_in_file(path: str) -> SubstringMatch:
+    # То же для файла корпуса: текст и префиксные массивы - из src.text_cache
+    return _longest_repeated(load_text(path), path)
+
+
+def longest_common_substring_in_files(path_a: str, path_b: str) -> SubstringMatch:
+    return _longest_common(load_text(path_a), load_text(path_b), path_a, path_b)
@@ -0,0 +1,106 @@
+from src.rabin_karp import _as_text, _pattern_for
+from src.search_stats import SearchStats
+from src.strategies import make_strategy
+from src.verify import make_verifier
+
+
+class MultiPatternRabinKarp(SearchStats):
+    """
+    МНОГОШАБЛОННЫЙ РАБИН-КАРП
+
+    Паттерны группируются по длине; для каждой группы хранится словарь
+    хеш -> список id паттернов. Для каждой различной длины текст проходится
+    скользящим хешем один раз, совпадения отдаются как (pattern_id, position).
+    pattern_id - индекс паттерна в исходной последовательности.
+    Для байтового текста str-паттерны ищутся в utf-8 (как в RabinKarp).
+    """
+
+    def __init__(self, hash_func, patterns, hash_name: str = ""):
+        self.hash_func = hash_func
+        self.patterns = list(patterns)
+
+        # Одна стратегия на все длины: состояние скольжения у каждого прохода своё
+        self.strategy = make_strategy(hash_func, hash_name)
+        self.hash_name = hash_name or self.strategy.name
+
+        # Группы для str и для байтового текста строятся при первом поиске
+        self._groups = {}
+
+        self._reset_stats()
+
+    def _groups_for(self, text) -> dict:
+        """
+        Длина -> словарь хеш -> [(id паттерна, паттерн в форме текста)].
+        Длины и хеши считаются по закодированным паттернам: в utf-8 длина
+        str-паттерна может отличаться от числа символов.
+        """
+        kind = isinstance(text, str)
+        groups = self._groups.get(kind)
+        if groups is None:
+            groups = {}
+            for pattern_id, pattern in enumerate(self.patterns):
+                pattern = _pattern_for(pattern, text)
+                if not pattern:
+                    continue
+                table = groups.setdefault(len(pattern), {})
+                table.setdefault(self.strategy(pattern), []).append((pattern_id, pattern))
+            self._groups[kind] = groups
+        return groups
+
+    def _scan_length(self, m: int, group: dict, text):
+        # Один проход по тексту для всех паттернов длины m
+        strategy = self.strategy
+        n = len(text)
+
+        # Проверка кандидатов без среза окна (src.verify)
+        table = {h: [(pattern_id, make_verifier(pattern, text)) for pattern_id, pattern in entries]
+                 for h, entries in group.items()}
+
+        window_hash, roll = strategy.init(text[:m])
+        window_hash_at = strategy.window_hash
+
+        to_code = ord if isinstance(text, str) else int
+
+        last = n - m
+        for i in range(last + 1):
+            candidates = table.get(window_hash)
+            if candidates is not None:
+                for pattern_id, verify in candidates:
+                    self.checks += 1
+                    if verify(i):
+                        yield pattern_id, i
+                    else:
+                        self.collisions += 1
+
+            if i < last:
+                if roll:
+                    window_hash = roll(window_hash, to_code(text[i]), to_code(text[i + m]))
+                else:
+                    window_hash = window_hash_at(text, i + 1, m)
+
+    def finditer(self, text: str):
+        """
+        Все вхождения всех паттернов: (pattern_id, position).
+        Порядок - по возрастанию длины паттерна, внутри длины - по позиции.
+        """
+        self._reset_stats()
+        yield from self._timed_positions(self._search(text))
+
+    def _search(self, text):
+        # Байтовый текст - через memoryview, чтобы срезы окон не копировались
+        text = _as_text(text)
+        groups = self._groups_for(text)
+        for m in sorted(groups):
+            if m <= len(text):
+                yield from self._scan_length(m, groups[m], text)
+
+    def findall(self, text: str) -> list:
+        return list(self.finditer(text))
+
+    def find_first(self, text: str) -> dict:
+        # pattern_id -> позиция первого вхождения (для сравнения с N вызовами find)
+        first = {}
+        for pattern_id, position in self.finditer(text):
+            if pattern_id not in first:
+                first[pattern_id] = position
+        return first
@@ -0,0 +1,150 @@
+"""
+ВЕКТОРИЗОВАННЫЙ БЭКЕНД (NumPy)
+
+Текст один раз кодируется в массив кодов символов, затем хеши всех окон
+считаются без цикла на Python:
+- simple_hash / chetsum_hash / first_last_hash - через префиксные суммы и сдвиги;
+- полиномиальные хеши - через префиксные суммы codes[t] * p^(-t) и массив степеней;
+- dna_hash - k-меры сдвигами в uint64 (k <= 32) или double_hash по 2-битным кодам.
+Произведения двух остатков должны оставаться в int64, поэтому полиномиальные
+хеши векторизуются только при модуле не больше MAX_MOD (у double_hash - < 2^30).
+"""
+import numpy as np
+
+from src.chetsum_hash import ChetSumHashStrategy
+from src.dna_hash import BASE_CODES, DNAHashStrategy, EXACT_K
+from src.double_hash import DoubleHashStrategy, P1, M1, P2, M2
+from src.first_last_hash import FirstLastHashStrategy
+from src.hash_simple import SimpleHashStrategy
+from src.hash_strategy import PolynomialStrategy
+
+# (mod - 1)^2 < 2^63: произведение остатков (степени, хеши окон) не переполняет int64
+MAX_MOD = 1 << 31
+
+
+def encode_text(text) -> np.ndarray:
+    # Коды символов (ord или значения байтов) одним массивом int64
+    if isinstance(text, str):
+        return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+    return np.frombuffer(text, dtype=np.uint8).astype(np.int64)
+
+
+def powers(p: int, mod: int, count: int) -> np.ndarray:
+    # p^0 .. p^(count-1) по модулю mod, удвоением блоков вместо цикла по count
+    pw = np.ones(count, dtype=np.int64)
+    size = 1
+    while size < count:
+        step = min(size, count - size)
+        pw[size:size + step] = pw[:step] * pow(p, size, mod) % mod
+        size += step
+    return pw
+
+
+def _prefix_sums(codes: np.ndarray) -> np.ndarray:
+    prefix = np.zeros(len(codes) + 1, dtype=np.int64)
+    np.cumsum(codes, out=prefix[1:])
+    return prefix
+
+
+def simple_window_hashes(codes: np.ndarray, m: int) -> np.ndarray:
+    prefix = _prefix_sums(codes)
+    return prefix[m:] - prefix[:-m]
+
+
+def chetsum_window_hashes(codes: np.ndarray, m: int) -> np.ndarray:
+    # Чётные позиции окна, начинающегося в i, - это абсолютные позиции с чётностью i
+    even = codes.copy()
+    even[1::2] = 0
+    odd = codes - even
+    even_prefix = _prefix_sums(even)
+    odd_prefix = _prefix_sums(odd)
+
+    hashes = even_prefix[m:] - even_prefix[:-m]
+    odd_hashes = odd_prefix[m:] - odd_prefix[:-m]
+    hashes[1::2] = odd_hashes[1::2]
+    return hashes
+
+
+def first_last_window_hashes(codes: np.ndarray, m: int) -> np.ndarray:
+    return codes[:len(codes) - m + 1] + codes[m - 1:]
+
+
+def polynomial_prefix(codes: np.ndarray, p: int, mod: int) -> tuple:
+    """
+    Не зависящие от длины окна массивы полиномиального хеша:
+    prefix[k] = sum(codes[t] * p^-t, t < k) и степени p^t (mod mod).
+    Их можно посчитать один раз на текст (см. src.longest_substring, src.text_cache).
+    """
+    n = len(codes)
+    inv_pw = powers(pow(p, -1, mod), mod, n)
+    prefix = _prefix_sums(codes * inv_pw % mod)
+    return prefix, powers(p, mod, n)
+
+
+def polynomial_window_hashes_from_prefix(prefix: np.ndarray, pw: np.ndarray, m: int, mod: int) -> np.ndarray:
+    # hash(i) = (sum codes[i+j] * p^-(i+j)) * p^(i+m-1)  (mod mod)
+    window_sums = (prefix[m:] - prefix[:-m]) % mod
+    return window_sums * pw[m - 1:] % mod
+
+
+def polynomial_window_hashes(codes: np.ndarray, m: int, p: int, mod: int) -> np.ndarray:
+    prefix, pw = polynomial_prefix(codes, p, mod)
+    return polynomial_window_hashes_from_prefix(prefix, pw, m, mod)
+
+
+def double_window_hashes(codes: np.ndarray, m: int) -> np.ndarray:
+    h1 = polynomial_window_hashes(codes, m, P1, M1)
+    h2 = polynomial_window_hashes(codes, m, P2, M2)
+    return (h1 << 32) | h2
+
+
+# Код символа (< 256) -> 2-битный код основания, как в src.dna_hash
+_BASE_LOOKUP = np.zeros(256, dtype=np.uint8)
+for _code, _base in BASE_CODES.items():
+    _BASE_LOOKUP[_code] = _base
+
+
+def base_codes(codes: np.ndarray) -> np.ndarray:
+    # Коды символов -> 2-битные коды (символы вне A/C/G/T -> 0)
+    return np.where(codes < 256, _BASE_LOOKUP[np.minimum(codes, 255)], 0).astype(np.uint8)
+
+
+def dna_window_hashes(bases: np.ndarray, m: int) -> np.ndarray:
+    # bases - 2-битные коды; результат совпадает с dna_hash окна
+    count = len(bases) - m + 1
+    if m <= EXACT_K:
+        hashes = np.zeros(count, dtype=np.uint64)
+        for j in range(m):
+            hashes = (hashes << np.uint64(2)) | bases[j:j + count].astype(np.uint64)
+        return hashes
+    return double_window_hashes(bases.astype(np.int64), m)
+
+
+def window_hashes(strategy, codes: np.ndarray, m: int) -> np.ndarray:
+    # Хеши всех окон длины m (массив длины n - m + 1)
+    if isinstance(strategy, DoubleHashStrategy):
+        return double_window_hashes(codes, m)
+    if isinstance(strategy, PolynomialStrategy):
+        return polynomial_window_hashes(codes, m, strategy.p, strategy.mod)
+    if isinstance(strategy, SimpleHashStrategy):
+        return simple_window_hashes(codes, m)
+    if isinstance(strategy, ChetSumHashStrategy):
+        return chetsum_window_hashes(codes, m)
+    if isinstance(strategy, FirstLastHashStrategy):
+        return first_last_window_hashes(codes, m)
+    if isinstance(strategy, DNAHashStrategy):
+        return dna_window_hashes(base_codes(codes), m)
+    raise ValueError(f"{strategy.name}: нет векторизованной версии для backend='numpy'")
+
+
+def supports(strategy) -> bool:
+    if isinstance(strategy, PolynomialStrategy):
+        return strategy.mod <= MAX_MOD
+    return isinstance(strategy, (DoubleHashStrategy, SimpleHashStrategy,
+                                 ChetSumHashStrategy, FirstLastHashStrategy, DNAHashStrategy))
+
+
+def candidates(strategy, pattern_hash: int, m: int, text) -> np.ndarray:
+    # Позиции окон длины m, чей хеш совпал с хешем паттерна
+    hashes = window_hashes(strategy, encode_text(text), m)
+    return np.flatnonzero(hashes == pattern_hash)
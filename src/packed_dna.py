@@ -0,0 +1,76 @@
+"""
+УПАКОВАННАЯ ДНК: 2 БИТА НА ОСНОВАНИЕ
+
+Последовательность A/C/G/T хранится в массиве uint8 по 4 основания в байте -
+в 4 раза меньше, чем bytes или ASCII-str (1 байт на символ). RabinKarp(dna_hash).finditer(pattern, packed) ищет прямо по
+упакованным данным: блоки распаковываются в 2-битные коды, хеши окон
+(dna_hash) считаются векторно, кандидаты сверяются по кодам.
+Позиции - в основаниях. Регистр не хранится: поиск нечувствителен к регистру.
+"""
+import numpy as np
+
+from src.dna_hash import BASE_CODES
+from src.numpy_backend import base_codes, dna_window_hashes, encode_text
+
+BASES = "ACGT"
+
+# Сколько окон распаковывается за раз при поиске
+PACKED_BLOCK = 1 << 20
+
+
+class PackedDNA:
+
+    def __init__(self, packed: np.ndarray, length: int):
+        self.packed = packed
+        self.length = length
+
+    @classmethod
+    def from_text(cls, text) -> "PackedDNA":
+        """str или bytes только из A/C/G/T (в любом регистре)"""
+        codes = encode_text(text)
+        invalid = ~np.isin(codes, list(BASE_CODES))
+        if invalid.any():
+            position = int(np.argmax(invalid))
+            raise ValueError(f"Не ДНК-символ {chr(codes[position])!r} в позиции {position}")
+
+        bases = base_codes(codes)
+        padded = np.zeros(-(-len(bases) // 4) * 4, dtype=np.uint8)
+        padded[:len(bases)] = bases
+        quads = padded.reshape(-1, 4)
+        packed = (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
+        return cls(packed.astype(np.uint8), len(bases))
+
+    @classmethod
+    def from_file(cls, path: str) -> "PackedDNA":
+        # Переводы строк и пробелы (как в FASTA) пропускаются
+        with open(path, "rb") as f:
+            return cls.from_text(b"".join(f.read().split()))
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def nbytes(self) -> int:
+        return self.packed.nbytes
+
+    def codes(self, start: int = 0, end: int = None) -> np.ndarray:
+        """2-битные коды оснований [start, end) (распаковываются только нужные байты)"""
+        end = self.length if end is None else min(end, self.length)
+        if start >= end:
+            return np.zeros(0, dtype=np.uint8)
+        chunk = self.packed[start // 4:(end + 3) // 4]
+        unpacked = np.stack([(chunk >> 6) & 3, (chunk >> 4) & 3, (chunk >> 2) & 3, chunk & 3], axis=1).ravel()
+        offset = start - start // 4 * 4
+        return unpacked[offset:offset + end - start]
+
+    def decode(self, start: int = 0, end: int = None) -> str:
+        return "".join(BASES[code] for code in self.codes(start, end).tolist())
+
+
+def window_hash_blocks(packed: PackedDNA, m: int, block: int = PACKED_BLOCK):
+    """(начало блока, 2-битные коды блока, dna_hash окон блока) по блокам из block окон"""
+    windows = len(packed) - m + 1
+    for block_start in range(0, windows, block):
+        block_end = min(block_start + block, windows)
+        bases = packed.codes(block_start, block_end + m - 1)
+        yield block_start, bases, dna_window_hashes(bases, m)
@@ -0,0 +1,178 @@
+"""
+ПАРАЛЛЕЛЬНЫЙ ПОИСК ПО ШАРДАМ
+
+Текст делится на шарды по позициям начала окон; каждый шард получает ещё
+m-1 символов следующего, поэтому вхождения на границах не теряются и
+не дублируются. Текст не пиклится в каждую задачу: str кладётся в общую
+память (utf-32-le, 4 байта на символ), bytes - как есть, файл - через mmap.
+"""
+import mmap
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from src.double_hash import double_hash
+from src.rabin_karp import RabinKarp
+from src.search_stats import SearchStats
+
+
+def _search_shard(source: tuple, start: int, end: int, pattern, hash_func, first_only: bool) -> tuple:
+    """
+    Поиск в окнах [start, end) источника.
+    source: ("str", имя сегмента) / ("bytes", имя сегмента) / ("file", путь)
+    Возвращает (позиции, checks, collisions).
+    """
+    kind, where = source
+    m = len(pattern)
+    algorithm = RabinKarp(hash_func)
+
+    if kind == "str":
+        shm = shared_memory.SharedMemory(name=where)
+        try:
+            shard = bytes(shm.buf[4 * start:4 * (end + m - 1)]).decode("utf-32-le")
+        finally:
+            shm.close()
+        positions = _run(algorithm, pattern, shard, first_only)
+    elif kind == "bytes":
+        shm = shared_memory.SharedMemory(name=where)
+        view = shm.buf[start:end + m - 1]
+        try:
+            positions = _run(algorithm, pattern, view, first_only)
+        finally:
+            view.release()
+            shm.close()
+    else:
+        with open(where, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)[start:end + m - 1]
+            try:
+                positions = _run(algorithm, pattern, view, first_only)
+            finally:
+                view.release()
+
+    return [start + i for i in positions], algorithm.checks, algorithm.collisions
+
+
+def _run(algorithm: RabinKarp, pattern, shard, first_only: bool) -> list:
+    if first_only:
+        position = algorithm.find(pattern, shard)
+        return [] if position == -1 else [position]
+    return algorithm.findall(pattern, shard)
+
+
+def _shard_bounds(total_windows: int, shards: int) -> list:
+    # Равные диапазоны начал окон
+    step = -(-total_windows // shards)
+    return [(a, min(a + step, total_windows)) for a in range(0, total_windows, step)]
+
+
+class ParallelRabinKarp(SearchStats):
+    """
+    RabinKarp на пуле процессов.
+    Позиции сливаются по порядку, checks / collisions суммируются по шардам
+    (совпадают с последовательным finditer), time_ns - общее время вызова по
+    часам: вместе с кодированием текста, копией в общую память и запуском пула.
+    setup_ns - отдельно подготовка текста (кодирование и общая память).
+    """
+
+    def __init__(self, hash_func=double_hash, workers: int = None, shards: int = None):
+        self.hash_func = hash_func
+        self.workers = workers or os.cpu_count() or 1
+        self.shards = shards or self.workers
+
+        self._reset_stats()
+        self.setup_ns = 0
+
+    def _search(self, pattern, source: tuple, n: int, first_only: bool) -> list:
+        # Шарды на пуле процессов; checks / collisions копятся в self
+        m = len(pattern)
+        positions = []
+        if pattern and m <= n:
+            bounds = _shard_bounds(n - m + 1, self.shards)
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(_search_shard, source, a, b, pattern, self.hash_func, first_only)
+                           for a, b in bounds]
+                # Шарды упорядочены, поэтому позиции сливаются простым склеиванием
+                for future in futures:
+                    shard_positions, checks, collisions = future.result()
+                    positions.extend(shard_positions)
+                    self.checks += checks
+                    self.collisions += collisions
+                    if first_only and positions:
+                        for rest in futures:
+                            rest.cancel()
+                        break
+
+        return positions
+
+    def _search_text(self, pattern, text, first_only: bool) -> list:
+        # Текст копируется в общую память один раз на вызов, воркеры подключаются по имени
+        self._reset_stats()
+        self.setup_ns = 0
+        start_time = time.perf_counter_ns()
+
+        if isinstance(text, str):
+            data = text.encode("utf-32-le")
+            kind, n = "str", len(text)
+        else:
+            if isinstance(pattern, str):
+                pattern = pattern.encode("utf-8")
+            pattern = bytes(pattern)
+            data = memoryview(text).cast("B")
+            kind, n = "bytes", len(data)
+
+        if not n:
+            positions = self._search(pattern, (kind, ""), 0, first_only)
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=len(data))
+            try:
+                shm.buf[:len(data)] = data
+                self.setup_ns = time.perf_counter_ns() - start_time
+                positions = self._search(pattern, (kind, shm.name), n, first_only)
+            finally:
+                shm.close()
+                shm.unlink()
+
+        self.time_ns = time.perf_counter_ns() - start_time
+        return positions
+
+    def findall(self, pattern, text) -> list:
+        """Все позиции вхождений в str или bytes-подобном тексте"""
+        return self._search_text(pattern, text, False)
+
+    def finditer(self, pattern, text):
+        # Шарды считаются целиком, позиции отдаются по возрастанию
+        yield from self._search_text(pattern, text, False)
+
+    def find(self, pattern, text) -> int:
+        # Первое вхождение: шарды после первого найденного отменяются
+        positions = self._search_text(pattern, text, True)
+        return positions[0] if positions else -1
+
+    def findall_in_file(self, path: str, pattern) -> list:
+        # Воркеры сами отображают файл в память; позиции - в байтах
+        self._reset_stats()
+        self.setup_ns = 0
+        start_time = time.perf_counter_ns()
+
+        if isinstance(pattern, str):
+            pattern = pattern.encode("utf-8")
+        positions = self._search(bytes(pattern), ("file", path), os.path.getsize(path), False)
+
+        self.time_ns = time.perf_counter_ns() - start_time
+        return positions
+
+    def get_stats(self) -> dict:
+        return {**super().get_stats(), "setup_ns": self.setup_ns, "setup_ms": self.setup_ns / 1_000_000}
+
+
+def parallel_findall(pattern, text, hash_func=double_hash, workers: int = None) -> list:
+    return ParallelRabinKarp(hash_func, workers).findall(pattern, text)
+
+
+def parallel_finditer(pattern, text, hash_func=double_hash, workers: int = None):
+    return ParallelRabinKarp(hash_func, workers).finditer(pattern, text)
+
+
+def parallel_find(pattern, text, hash_func=double_hash, workers: int = None) -> int:
+    return ParallelRabinKarp(hash_func, workers).find(pattern, text)
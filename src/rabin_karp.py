@@ -1,173 +1,628 @@
+import json
+import mmap
 import time
 
+import numpy as np
+
+from src.approx_search import make_hamming_verifier, split_pieces
+from src.auto_hash import AutoSelector, CANDIDATES, SEGMENT_WINDOWS
+from src.compiled_pattern import CompiledPattern, compile_cached
+from src.dna_hash import DNAHashStrategy
+from src.double_hash import double_hash
+from src.hash_strategy import PolynomialStrategy
+from src.instrumentation import SearchProfile
+from src.packed_dna import PackedDNA, window_hash_blocks
+from src.search_stats import SearchStats
+from src.strategies import make_strategy
+from src.verify import make_verifier
+
+
+def _as_text(text):
+    """
+    str ищется как есть. bytes / bytearray / memoryview / mmap оборачиваются
+    в memoryview: срезы окон не копируют данные, позиции - в байтах.
+    """
+    if isinstance(text, str):
+        return text
+    return memoryview(text).cast("B")
+
+
+def _pattern_for(pattern, text):
+    # Паттерн в виде текста: str для str, bytes (utf-8) для байтовых данных
+    if isinstance(pattern, CompiledPattern):
+        return pattern.for_text(text)[0]
+    if not isinstance(text, str):
+        return pattern.encode("utf-8") if isinstance(pattern, str) else bytes(pattern)
+    return pattern
+
+
+class RabinKarp(SearchStats):
+    # Без __dict__: объект поиска легче, опечатка в имени атрибута - сразу AttributeError
+    __slots__ = ("auto", "auto_stats", "approx_stats", "strategy", "hash_func", "hash_name", "backend",
+                 "_numpy_backend", "collisions", "checks", "time_ns", "instrument", "profile", "_hooks")
+
+    def __init__(self, hash_func, hash_name: str = "", backend: str = "python", instrument: bool = False):
+        # hash_func - функция хеширования или готовая HashStrategy
+        # backend - "python" (скользящий хеш) или "numpy" (векторизованные хеши окон)
+        # instrument - профиль по фазам и счётчики окон (см. src.instrumentation)
+        # hash_func="auto" (или AutoSelector) - выбор хеш-функции по тексту, см. src.auto_hash
+        self.auto = None
+        if isinstance(hash_func, str) and hash_func == "auto":
+            hash_func = AutoSelector()
+        if isinstance(hash_func, AutoSelector):
+            self.auto = hash_func
+            hash_func = double_hash
+            hash_name = hash_name or "auto"
+            if backend != "python":
+                raise ValueError("auto: поддерживается только backend='python'")
+        self.auto_stats = {}
+        self.approx_stats = {}
+
+        self.strategy = make_strategy(hash_func, hash_name)
+        self.hash_func = self.strategy
+        self.hash_name = hash_name or self.strategy.name
+
+        self.backend = backend
+        self._numpy_backend = None
+        if backend == "numpy":
+            from src import numpy_backend
+            if self.strategy.brute_force or numpy_backend.supports(self.strategy):
+                self._numpy_backend = numpy_backend
+            elif isinstance(self.strategy, PolynomialStrategy):
+                # Модуль больше numpy_backend.MAX_MOD: в int64 произведения переполнились бы,
+                # поэтому остаётся проход скользящим хешем на Python
+                self.backend = "python"
+            else:
+                raise ValueError(f"{self.hash_name}: backend='numpy' не поддерживается")
+        elif backend != "python":
+            raise ValueError(f"Неизвестный backend: {backend}")
+
+        self._reset_stats()
+
+        self.instrument = instrument
+        self.profile = None
+        self._hooks = []
+
+    def add_hook(self, callback):
+        """
+        callback(profile: SearchProfile) вызывается после каждого прохода поиска
+        (в том числе прерванного, как в find). Добавление хука включает инструментирование.
+        """
+        self._hooks.append(callback)
+        self.instrument = True
 
-class RabinKarp:
+    def remove_hook(self, callback):
+        self._hooks.remove(callback)
 
-    def __init__(self, hash_func, hash_name: str = ""):
-        self.hash_func = hash_func
-        self.hash_name = hash_name
+    def _start_profile(self):
+        self.profile = SearchProfile(self.hash_name) if self.instrument else None
 
-        # Если передали linear_hash, но не указали имя
-        if hasattr(hash_func, 'name'):
-            self.hash_name = hash_func.name
+    def _publish_profile(self):
+        if self.profile is not None:
+            for hook in self._hooks:
+                hook(self.profile)
 
-        self.collisions = 0
-        self.checks = 0
-        self.time_ns = 0
+    def _linear_scan(self, pattern: str, text: str, start: int = 0, offset: int = 0):
+        # Линейный поиск для linear_hash: каждое окно сравнивается посимвольно
+        m = len(pattern)
+        total_windows = len(text) - m + 1
 
-    def _get_rolling_func(self, pattern_length: int, p: int = 31, m: int = 10 ** 9 + 7):
+        for i in range(start, total_windows):
+            # коллизий нет, проверка - каждое окно
+            self.checks += 1
+            if text[i:i + m] == pattern:
+                yield offset + i
 
-        # Для linear_hash (линейный поиск) - НЕТ скользящего хеша
-        if "linear" in self.hash_name.lower():
-            return None  # Будем пересчитывать каждый раз
+    def _linear_scan_profiled(self, pattern: str, text: str, start: int = 0, offset: int = 0):
+        # _linear_scan с замером сравнений (все они - фаза verify)
+        profile = self.profile
+        phases = profile.phase_ns
+        perf = time.perf_counter_ns
+        m = len(pattern)
 
-        if "simple" in self.hash_name.lower():
-            return self._simple_rolling
+        for i in range(start, len(text) - m + 1):
+            self.checks += 1
+            t = perf()
+            equal = text[i:i + m] == pattern
+            phases["verify"] += perf() - t
+            profile.verifications += 1
+            profile.verify_bytes += m
+            if equal:
+                yield offset + i
+
+    def _compiled_profiled(self, pattern) -> CompiledPattern:
+        t = time.perf_counter_ns()
+        compiled = self._compiled(pattern)
+        self.profile.phase_ns["compile"] += time.perf_counter_ns() - t
+        return compiled
+
+    def _compiled(self, pattern) -> CompiledPattern:
+        """
+        Паттерн -> CompiledPattern: готовый проверяется на совместимость со стратегией,
+        str / bytes берутся из LRU-кеша (хеш и константы не пересчитываются)
+        """
+        if isinstance(pattern, CompiledPattern):
+            if pattern.strategy_key != self.strategy.key():
+                raise ValueError(f"Паттерн скомпилирован для другой стратегии, а не {self.hash_name}")
+            return pattern
+        return compile_cached(pattern, self.strategy)
+
+    def _rolling_scan(self, pattern: str, pattern_hash: int, constants: tuple, text: str):
+        # Один проход скользящим хешем, отдаёт все позиции совпадений
+        m = len(pattern)
 
-        elif "weighted" in self.hash_name.lower():
-            return self._weighted_rolling
+        # 1-2. Хеш паттерна уже посчитан при компиляции; хеш первого окна текста
+        # (стратегия готовится к скольжению с готовыми константами)
+        if self.profile is None:
+            window_hash, roll = self.strategy.init(text[:m], constants)
+            yield from self._scan_windows(pattern, pattern_hash, text, window_hash, roll)
+            return
 
-        elif "polynomial" in self.hash_name.lower():
-            return lambda h, old, new: self._polynomial_rolling(h, old, new, pattern_length, p, m)
+        t = time.perf_counter_ns()
+        window_hash, roll = self.strategy.init(text[:m], constants)
+        self.profile.phase_ns["init"] += time.perf_counter_ns() - t
+        yield from self._scan_windows_profiled(pattern, pattern_hash, text, window_hash, roll)
 
-        else:
-            return None
+    def _scan_windows(self, pattern: str, pattern_hash: int, text: str, window_hash: int,
+                      roll=None, start: int = 0, offset: int = 0, strategy=None):
+        """
+        Проверяет окна text[start:], начиная с окна start с хешем window_hash.
+        roll - скольжение этого прохода из strategy.init (None - пересчёт окна с нуля),
+        strategy - стратегия прохода (по умолчанию self.strategy).
+        Позиции сдвигаются на offset. Возвращает хеш последнего окна.
+        """
+        m = len(pattern)
+        n = len(text)
 
-    def _simple_rolling(self, old_hash: int, old_char: str, new_char: str) -> int:
-        # Скользящий хеш для simple_hash (сумма кодов)
-        return old_hash - ord(old_char) + ord(new_char)
+        # 3. Шаг скольжения выбирается один раз до цикла
+        window_hash_at = (strategy or self.strategy).window_hash
 
-    def _weighted_rolling(self, old_hash: int, old_char: str, new_char: str,
-                          first_char_weight: int, base: int = 31) -> int:
-        # Скользящий хеш для weighted_sum_hash
-        return (old_hash - ord(old_char) * first_char_weight) * base + ord(new_char)
+        # Коды символов: ord для str, для memoryview text[i] уже int
+        to_code = ord if isinstance(text, str) else int
 
-    def _polynomial_rolling(self, old_hash: int, old_char: str, new_char: str,
-                            m: int, p: int = 31, mod: int = 10 ** 9 + 7) -> int:
-        # Скользящий хеш для polynomial_hash
-        p_pow = pow(p, m - 1, mod)
+        # Проверка кандидата без среза окна (src.verify)
+        verify = make_verifier(pattern, text)
+
+        # 4. Основной цикл поиска
+        last = n - m
+        for i in range(start, last + 1):
+            # Если хеши совпали
+            if window_hash == pattern_hash:
+                # Увеличиваем счётчик проверок
+                self.checks += 1
 
-        new_hash = (old_hash - ord(old_char) * p_pow) % mod
+                # Проверяем посимвольно (на случай коллизии)
+                if verify(i):
+                    yield offset + i
+                else:
+                    # Коллизия: хеши совпали, но строки разные
+                    self.collisions += 1
 
-        new_hash = (new_hash * p + ord(new_char)) % mod
+            if i < last:
+                if roll:
+                    window_hash = roll(window_hash, to_code(text[i]), to_code(text[i + m]))
+                else:
+                    # Для функций без скользящего хеша пересчитываем окно
+                    window_hash = window_hash_at(text, i + 1, m)
 
-        return new_hash
+        return window_hash
 
-    def _linear_search(self, pattern: str, text: str, start_time: int) -> int:
-        # Оптимизированный линейный поиск для linear_hash
+    def _scan_windows_profiled(self, pattern: str, pattern_hash: int, text: str, window_hash: int,
+                               roll=None, start: int = 0, offset: int = 0, strategy=None):
+        # _scan_windows с замером каждой операции по фазам roll / rehash / verify
+        profile = self.profile
+        phases = profile.phase_ns
+        perf = time.perf_counter_ns
         m = len(pattern)
         n = len(text)
-        total_windows = n - m + 1
 
-        # Простой линейный поиск
-        for i in range(total_windows):
-            if text[i:i + m] == pattern:
-                self.checks = i + 1
-                self.collisions = 0  # коллизий нет
-                self.time_ns = time.perf_counter_ns() - start_time
-                return i
-
-        # Не нашли
-        self.checks = total_windows
-        self.collisions = 0
-        self.time_ns = time.perf_counter_ns() - start_time
-        return -1
+        window_hash_at = (strategy or self.strategy).window_hash
+        to_code = ord if isinstance(text, str) else int
+        verify = make_verifier(pattern, text)
 
-    def find(self, pattern: str, text: str) -> int:
-        # Сбрасываем статистику
-        self.collisions = 0
-        self.checks = 0
+        last = n - m
+        for i in range(start, last + 1):
+            if window_hash == pattern_hash:
+                self.checks += 1
+                t = perf()
+                equal = verify(i)
+                phases["verify"] += perf() - t
+                profile.verifications += 1
+                profile.verify_bytes += m
+
+                if equal:
+                    yield offset + i
+                else:
+                    self.collisions += 1
 
-        # замер времени
-        start_time = time.perf_counter_ns()
+            if i < last:
+                t = perf()
+                if roll:
+                    window_hash = roll(window_hash, to_code(text[i]), to_code(text[i + m]))
+                    phases["roll"] += perf() - t
+                    profile.windows_rolled += 1
+                else:
+                    window_hash = window_hash_at(text, i + 1, m)
+                    phases["rehash"] += perf() - t
+                    profile.windows_rehashed += 1
 
-        # Проверка данных
-        if not pattern or not text or len(pattern) > len(text):
-            self.time_ns = time.perf_counter_ns() - start_time
-            return -1
+        return window_hash
 
+    def _numpy_scan(self, pattern: str, pattern_hash: int, text: str):
+        # Хеши всех окон считаются векторно, посимвольно проверяются только кандидаты
         m = len(pattern)
-        n = len(text)
-
-        # ОБРАБОТКА ДЛЯ LINEAR_HASH
-        if "linear" in self.hash_name.lower():
-            return self._linear_search(pattern, text, start_time)
-
+        profile = self.profile
+        t = time.perf_counter_ns()
+        candidates = self._numpy_backend.candidates(self.strategy, pattern_hash, m, text).tolist()
+        if profile is not None:
+            profile.phase_ns["init"] += time.perf_counter_ns() - t
+
+        verify = make_verifier(pattern, text)
+        for i in candidates:
+            self.checks += 1
+            if profile is not None:
+                t = time.perf_counter_ns()
+                equal = verify(i)
+                profile.phase_ns["verify"] += time.perf_counter_ns() - t
+                profile.verifications += 1
+                profile.verify_bytes += m
+            else:
+                equal = verify(i)
+            if equal:
+                yield i
+            else:
+                self.collisions += 1
+
+    def finditer(self, pattern, text: str):
         """
-        Поиск паттерна в тексте.
-        Возвращает позицию первого вхождения или -1 если не найдено.
+        Ленивый поиск всех вхождений за один проход.
+        pattern - str, bytes или CompiledPattern (см. src.compiled_pattern.compile).
+        Статистика (checks, collisions, time_ns) копится по всему проходу;
+        время, пока вызывающий код обрабатывает очередную позицию, не учитывается.
         """
-        # Сбрасываем статистику
-        self.collisions = 0
-        self.checks = 0
+        yield from self._timed(self._search(pattern, text))
 
-        # Начинаем замер времени
-        start_time = time.perf_counter_ns()
+    def finditer_approx(self, pattern, text: str, k: int):
+        """
+        Все окна, отличающиеся от паттерна не более чем в k позициях (только замены),
+        по возрастанию позиции; см. src.approx_search. Кроме checks / collisions
+        (по кускам паттерна) в get_stats() - нагрузка проверки: approx_candidates
+        (проверенные окна) и approx_verify_chars (сравнённые символы).
+        linear_search - наивный проход: каждое окно проверяется по Хэммингу.
+        """
+        if self.auto is not None:
+            raise ValueError("auto: поиск с несовпадениями не поддерживается, выберите хеш-функцию явно")
+        if k < 0:
+            raise ValueError(f"k должно быть >= 0, получено {k}")
+        yield from self._timed(self._approx_scan(pattern, text, k))
+
+    def _timed(self, positions):
+        # Сбрасываем статистику и замеряем время прохода (src.search_stats)
+        self._reset_stats()
+        self.auto_stats = {}
+        self.approx_stats = {}
+        self._start_profile()
+
+        try:
+            yield from self._timed_positions(positions)
+        finally:
+            self._publish_profile()
+
+    def _search(self, pattern, text):
+        # Выбор прохода под стратегию и backend
+        if self.auto is not None:
+            yield from self._auto_scan(pattern, text)
+            return
+        if isinstance(text, PackedDNA):
+            yield from self._packed_scan(pattern, text)
+            return
+
+        compiled = self._compiled(pattern) if self.profile is None else self._compiled_profiled(pattern)
 
         # Проверка входных данных
-        if not pattern or not text or len(pattern) > len(text):
-            self.time_ns = time.perf_counter_ns() - start_time
-            return -1
+        if not text:
+            return
 
-        m = len(pattern)
-        n = len(text)
+        text = _as_text(text)
+        pattern, pattern_hash, constants = compiled.for_text(text)
+        if not pattern or len(pattern) > len(text):
+            return
 
-        # 1. Вычисляем хеш паттерна
-        pattern_hash = self.hash_func(pattern)
+        # ОБРАБОТКА ДЛЯ LINEAR_HASH
+        if self.strategy.brute_force:
+            if self.profile is None:
+                yield from self._linear_scan(pattern, text)
+            else:
+                yield from self._linear_scan_profiled(pattern, text)
+        elif self._numpy_backend is not None:
+            yield from self._numpy_scan(pattern, pattern_hash, text)
+        else:
+            yield from self._rolling_scan(pattern, pattern_hash, constants, text)
+
+    def _packed_scan(self, pattern, packed):
+        # Поиск по упакованной ДНК (src.packed_dna): векторные хеши блоков, проверка по 2-битным кодам
+        if not isinstance(self.strategy, DNAHashStrategy):
+            raise ValueError(f"{self.hash_name}: для PackedDNA нужен dna_hash")
+        if isinstance(pattern, CompiledPattern):
+            pattern = pattern.encoded
+        try:
+            pattern_bases = PackedDNA.from_text(pattern).codes()
+        except ValueError:
+            return  # в паттерне не только A/C/G/T - вхождений нет
+        m = len(pattern_bases)
+        if not m or m > len(packed):
+            return
+
+        pattern_hash = self.strategy(pattern)
+        for block_start, bases, hashes in window_hash_blocks(packed, m):
+            for j in np.flatnonzero(hashes == pattern_hash).tolist():
+                self.checks += 1
+                if np.array_equal(bases[j:j + m], pattern_bases):
+                    yield block_start + j
+                else:
+                    self.collisions += 1
 
-        # 2. Вычисляем хеш первого окна текста
-        first_window = text[:m]
-        window_hash = self.hash_func(first_window)
+    def _approx_scan(self, pattern, text, k: int):
+        # Куски длины q и q + 1 ищутся одним скользящим хешем окон длины q (куски
+        # длины q + 1 - по своему префиксу). Окно-кандидат проверяется, когда
+        # пройдены все его куски, поэтому позиции идут по возрастанию
+        if not text:
+            return
+        text = _as_text(text)
+        pattern = _pattern_for(pattern, text)
+        m, n = len(pattern), len(text)
+        if not m or m > n:
+            return
+
+        stats = self.approx_stats = {"approx_k": k, "approx_candidates": 0, "approx_verify_chars": 0}
+        verify = make_hamming_verifier(pattern, text, k)
+
+        # Наивный проход; при k >= m куски пустые - подходит любое окно
+        if self.strategy.brute_force or k >= m:
+            for i in range(n - m + 1):
+                found, compared = verify(i)
+                stats["approx_candidates"] += 1
+                stats["approx_verify_chars"] += compared
+                if found:
+                    yield i
+            self._count_approx_profile()
+            return
+
+        strategy = self.strategy
+        pieces = split_pieces(pattern, k)
+        q = len(pieces[0][1])
+        # хеш префикса длины q -> [(смещение, конец куска в окне, проверка куска)]
+        table = {}
+        for offset, piece in pieces:
+            table.setdefault(strategy(piece[:q]), []).append(
+                (offset, len(piece), make_verifier(piece, text)))
+
+        get = table.get
+        to_code = ord if isinstance(text, str) else int
+        last_offset = pieces[-1][0]
+        last_start = n - m
+        last = n - q
+        pending = set()
+
+        window_hash, roll = strategy.init(text[:q], strategy.prepare(q))
+        for i in range(last + 1):
+            hits = get(window_hash)
+            if hits is not None:
+                for offset, length, verify_piece in hits:
+                    if i + length > n:
+                        continue
+                    self.checks += 1
+                    if verify_piece(i):
+                        start = i - offset
+                        if 0 <= start <= last_start:
+                            pending.add(start)
+                    else:
+                        self.collisions += 1
+
+            # Все куски окна, начинающегося в ready, уже пройдены
+            ready = i - last_offset
+            if pending and ready in pending:
+                pending.remove(ready)
+                found, compared = verify(ready)
+                stats["approx_candidates"] += 1
+                stats["approx_verify_chars"] += compared
+                if found:
+                    yield ready
+
+            if i < last:
+                if roll:
+                    window_hash = roll(window_hash, to_code(text[i]), to_code(text[i + q]))
+                else:
+                    window_hash = strategy.window_hash(text, i + 1, q)
+        self._count_approx_profile()
 
-        # 3. Получаем функцию для скользящего хеша
-        rolling_func = self._get_rolling_func(m)
+    def _count_approx_profile(self):
+        # Проверки по Хэммингу - в счётчики профиля (фазы не замеряются)
+        if self.profile is not None:
+            self.profile.verifications += self.approx_stats["approx_candidates"]
+            self.profile.verify_bytes += self.approx_stats["approx_verify_chars"]
 
-        first_char_weight = 1
-        if "weighted" in self.hash_name.lower():
-            first_char_weight = 31 ** (m - 1)
+    def _auto_scan(self, pattern, text):
+        """
+        Проход с автовыбором хеш-функции: текст идёт сегментами по SEGMENT_WINDOWS
+        окон; при перерасходе бюджета коллизий - переход на более стойкую функцию.
+        Выбранная стратегия живёт в проходе, self.strategy не меняется
+        """
+        if not text:
+            return
+        text = _as_text(text)
+        pattern = _pattern_for(pattern, text)
+        m = len(pattern)
+        if not m or m > len(text):
+            return
+
+        auto = self.auto
+        index, rates, reason = auto.choose(text, m)
+        self.auto_stats = {"auto_hash": CANDIDATES[index][0], "auto_reason": reason, "auto_switches": 0}
+        scan_windows = self._scan_windows if self.profile is None else self._scan_windows_profiled
+        to_code = ord if isinstance(text, str) else int
+
+        last = len(text) - m
+        start = 0
+        strategy = None
+        while True:
+            if strategy is None:
+                strategy = make_strategy(CANDIDATES[index][1])
+                pattern_hash = strategy(pattern)
+                window_hash, roll = strategy.init(text[start:start + m], strategy.prepare(m))
+
+            # Окна [start, end) - сегмент текста с хвостом m-1 символов
+            end = min(start + SEGMENT_WINDOWS, last + 1)
+            collisions_before = self.collisions
+            window_hash = yield from scan_windows(pattern, pattern_hash, text[start:end + m - 1],
+                                                  window_hash, roll, 0, start, strategy)
+            if end > last:
+                return
+
+            observed = self.collisions - collisions_before
+            budget = auto.budget(end - start)
+            stronger = auto.stronger(index, rates)
+            if observed > budget and stronger != index:
+                self.auto_stats["auto_switches"] += 1
+                self.auto_stats["auto_hash"] = CANDIDATES[stronger][0]
+                self.auto_stats["auto_reason"] += (
+                    f"; окна {start}-{end - 1}: {observed} коллизий > бюджета {budget}, "
+                    f"{CANDIDATES[index][0]} -> {CANDIDATES[stronger][0]}")
+                index, strategy = stronger, None
+            elif roll:
+                window_hash = roll(window_hash, to_code(text[end - 1]), to_code(text[end - 1 + m]))
+            else:
+                window_hash = strategy.window_hash(text, end, m)
+            start = end
+
+    def _stream_scan(self, pattern, chunks):
+        # Скользящий хеш переживает границы чанков; от прошлых данных хранится
+        # только последнее окно (m символов): оно нужно для уходящего символа и проверки
+        if not len(pattern):
+            return
+        strategy = self.strategy
+        profile = self.profile
+        compiled = self._compiled(pattern) if profile is None else self._compiled_profiled(pattern)
+        linear_scan = self._linear_scan if profile is None else self._linear_scan_profiled
+        scan_windows = self._scan_windows if profile is None else self._scan_windows_profiled
+        started = False
+        window_hash = roll = None
+        carry = None
+        offset = 0  # глобальная позиция carry[0]
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+            if not isinstance(chunk, str):
+                chunk = bytes(chunk)
+            buffer = chunk if carry is None else carry + chunk
+
+            if not started:
+                # Форма паттерна (и его длина) зависит от типа чанков
+                pattern, pattern_hash, constants = compiled.for_text(buffer)
+                m = len(pattern)
+                if len(buffer) < m:
+                    carry = buffer
+                    continue
+                buffer = _as_text(buffer)
+                started = True
+                start = 0
+                if not strategy.brute_force:
+                    t = time.perf_counter_ns()
+                    window_hash, roll = strategy.init(buffer[:m], constants)
+                    if profile is not None:
+                        profile.phase_ns["init"] += time.perf_counter_ns() - t
+            else:
+                if not isinstance(buffer, str):
+                    buffer = memoryview(buffer)
+                # Окно 0 буфера уже проверено в прошлом чанке - сдвигаемся на окно 1
+                start = 1
+                t = time.perf_counter_ns()
+                if strategy.brute_force:
+                    pass
+                elif roll:
+                    to_code = ord if isinstance(buffer, str) else int
+                    window_hash = roll(window_hash, to_code(buffer[0]), to_code(buffer[m]))
+                    if profile is not None:
+                        profile.phase_ns["roll"] += time.perf_counter_ns() - t
+                        profile.windows_rolled += 1
+                else:
+                    window_hash = strategy.window_hash(buffer, 1, m)
+                    if profile is not None:
+                        profile.phase_ns["rehash"] += time.perf_counter_ns() - t
+                        profile.windows_rehashed += 1
+
+            if strategy.brute_force:
+                yield from linear_scan(pattern, buffer, start, offset)
+            else:
+                window_hash = yield from scan_windows(pattern, pattern_hash, buffer,
+                                                      window_hash, roll, start, offset)
+
+            # Переносим последнее окно в следующий чанк
+            offset += len(buffer) - m
+            carry = buffer[len(buffer) - m:]
+            if not isinstance(carry, str):
+                carry = bytes(carry)
+
+    def finditer_stream(self, pattern, chunks):
+        """
+        Потоковый поиск по итерируемому источнику чанков (str или bytes),
+        например файлу, читаемому блоками, или stdin.
+        Отдаёт глобальные позиции вхождений; в памяти - текущий чанк и m символов
+        предыдущих данных. Статистика копится как в finditer.
+        """
+        if self.auto is not None:
+            raise ValueError("auto: потоковый поиск не поддерживается, выберите хеш-функцию явно")
+        yield from self._timed(self._stream_scan(pattern, chunks))
 
-        # 4. Основной цикл поиска
-        for i in range(n - m + 1):
-            # Если хеши совпали
-            if window_hash == pattern_hash:
-                # Увеличиваем счётчик проверок
-                self.checks += 1
+    def find(self, pattern: str, text: str) -> int:
+        """
+        Поиск паттерна в тексте.
+        Возвращает позицию первого вхождения или -1 если не найдено.
+        """
+        return next(self.finditer(pattern, text), -1)
 
-                # Проверяем посимвольно (на случай коллизии)
-                if text[i:i + m] == pattern:
-                    # Нашли! Завершаем замер времени
-                    self.time_ns = time.perf_counter_ns() - start_time
-                    return i
-                else:
-                    # Коллизия: хеши совпали, но строки разные
-                    self.collisions += 1
+    def findall(self, pattern: str, text: str) -> list:
+        # Все позиции вхождений (в порядке возрастания)
+        return list(self.finditer(pattern, text))
 
-            if i < n - m:
-                if rolling_func:
-                    old_char = text[i]
-                    new_char = text[i + m]
+    def find_approx(self, pattern: str, text: str, k: int) -> int:
+        # Первое окно с не более чем k несовпадениями или -1
+        return next(self.finditer_approx(pattern, text, k), -1)
 
-                    if "weighted" in self.hash_name.lower():
-                        window_hash = rolling_func(window_hash, old_char, new_char, first_char_weight)
-                    elif "polynomial" in self.hash_name.lower():
-                        window_hash = rolling_func(window_hash, old_char, new_char)
-                    else:
-                        window_hash = rolling_func(window_hash, old_char, new_char)
-                else:
-                    # Для функций без скользящего хеша пересчитываем с нуля
-                    window = text[i + 1:i + m + 1]
-                    window_hash = self.hash_func(window)
+    def findall_approx(self, pattern: str, text: str, k: int) -> list:
+        return list(self.finditer_approx(pattern, text, k))
 
-        # Паттерн не найден
-        self.time_ns = time.perf_counter_ns() - start_time
-        return -1
+    def count(self, pattern: str, text: str) -> int:
+        # Количество вхождений (с перекрытиями)
+        return sum(1 for _ in self.finditer(pattern, text))
 
     def get_stats(self) -> dict:
-        # Возвращает статистику выполнения
-        return {
-            "collisions": self.collisions,
-            "checks": self.checks,
-            "time_ns": self.time_ns,
-            "time_ms": self.time_ns / 1_000_000,
-            "time_sec": self.time_ns / 1_000_000_000
-        }
+        # Возвращает статистику выполнения (с профилем по фазам, если он включён)
+        stats = super().get_stats()
+        if self.profile is not None:
+            stats.update(self.profile.to_dict())
+        stats.update(self.auto_stats)
+        stats.update(self.approx_stats)
+        return stats
+
+    def get_stats_json(self) -> str:
+        # Статистика одной записью JSON (для логов и внешних инструментов)
+        return json.dumps({"hash_name": self.hash_name, **self.get_stats()}, ensure_ascii=False)
+
+
+def find_in_file(path: str, pattern, hash_func=double_hash) -> int:
+    """
+    Поиск в файле без чтения в str: файл отображается в память (mmap),
+    позиция возвращается в байтах. Строковый паттерн кодируется в utf-8.
+    """
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            return -1
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return RabinKarp(hash_func).find(pattern, mm)
+
+
+def read_chunks(f, chunk_size: int = 1 << 20):
+    # Чтение открытого файла (или sys.stdin.buffer) блоками для finditer_stream
+    return iter(lambda: f.read(chunk_size), f.read(0))
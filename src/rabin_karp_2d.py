@@ -0,0 +1,139 @@
+"""
+ДВУМЕРНЫЙ РАБИН-КАРП: ПОИСК ПЛИТКИ r x c В СЕТКЕ
+
+Сетка - двумерный массив NumPy (целые коды или символы 'U1' / 'S1') или
+список строк (str или bytes) одинаковой длины.
+1. Хеши строк: в каждой строке окно ширины c скользит вправо (все строки
+   сразу, векторно) - полиномиальный хеш по основанию p.
+2. Хеш окна: столбец из r хешей строк скользит вниз по основанию p^c.
+С основанием p^c хеш окна равен полиномиальному хешу его строк, записанных
+подряд: та же хеш-функция, что у RabinKarp, для паттерна "".join(rows).
+Каждое окно обходится за O(1) амортизированно; совпадения хешей
+проверяются сравнением плиток, счётчики checks / collisions - как у RabinKarp.
+Поддерживаются полиномиальные стратегии: double_hash (оба полинома) и
+PolynomialStrategy с модулем не больше numpy_backend.MAX_MOD (арифметика в int64).
+"""
+
+import numpy as np
+
+from src.double_hash import DoubleHashStrategy, P1, M1, P2, M2, double_hash
+from src.hash_strategy import PolynomialStrategy
+from src import numpy_backend
+from src.numpy_backend import encode_text
+from src.search_stats import SearchStats
+from src.strategies import make_strategy
+
+
+def polynomial_params(strategy) -> list:
+    # [(p, mod)] по каждому полиному стратегии
+    if isinstance(strategy, DoubleHashStrategy):
+        return [(P1, M1), (P2, M2)]
+    if isinstance(strategy, PolynomialStrategy):
+        return [(strategy.p, strategy.mod)]
+    raise ValueError(f"{strategy.name}: для 2D нужна полиномиальная хеш-функция")
+
+
+def as_grid(grid) -> np.ndarray:
+    """Сетка -> двумерный массив кодов int64 (как encode_text для строк)"""
+    if isinstance(grid, np.ndarray):
+        if grid.ndim != 2:
+            raise ValueError(f"Ожидается двумерный массив, получено измерений: {grid.ndim}")
+        if grid.dtype.kind == "U" and grid.dtype.itemsize == 4:
+            return grid.view(np.uint32).astype(np.int64)
+        if grid.dtype.kind == "S" and grid.dtype.itemsize == 1:
+            return grid.view(np.uint8).astype(np.int64)
+        if grid.dtype.kind in "biu":
+            return grid.astype(np.int64)
+        raise ValueError(f"Неподдерживаемый тип элементов сетки: {grid.dtype}")
+
+    rows = [encode_text(row) for row in grid]
+    if not rows:
+        return np.zeros((0, 0), dtype=np.int64)
+    if len({len(row) for row in rows}) > 1:
+        raise ValueError("Строки сетки должны быть одной длины")
+    return np.stack(rows)
+
+
+def row_hashes(codes: np.ndarray, c: int, p: int, mod: int) -> np.ndarray:
+    # Хеши окон ширины c во всех строках: (R, C - c + 1); цикл по столбцам, строки - векторно
+    # Хеш не меняется, а произведения остаются в int64
+    codes = codes % mod
+    p %= mod
+    rows, cols = codes.shape
+    hashes = np.empty((rows, cols - c + 1), dtype=np.int64)
+    h = np.zeros(rows, dtype=np.int64)
+    for j in range(c):
+        h = (h * p + codes[:, j]) % mod
+    hashes[:, 0] = h
+    p_pow = pow(p, c - 1, mod)
+    for j in range(1, cols - c + 1):
+        h = ((h - codes[:, j - 1] * p_pow % mod) * p + codes[:, j + c - 1]) % mod
+        hashes[:, j] = h
+    return hashes
+
+
+def window_rows(hashes: np.ndarray, r: int, base: int, mod: int):
+    """Хеши окон высоты r построчно: (i, хеши окон с верхней строкой i)"""
+    h = np.zeros(hashes.shape[1], dtype=np.int64)
+    for i in range(r):
+        h = (h * base + hashes[i]) % mod
+    yield 0, h
+    base_pow = pow(base, r - 1, mod)
+    for i in range(1, hashes.shape[0] - r + 1):
+        h = ((h - hashes[i - 1] * base_pow % mod) % mod * base + hashes[i + r - 1]) % mod
+        yield i, h
+
+
+class RabinKarp2D(SearchStats):
+
+    def __init__(self, hash_func=double_hash, hash_name: str = ""):
+        self.strategy = make_strategy(hash_func, hash_name)
+        self.hash_name = hash_name or self.strategy.name
+        self.params = polynomial_params(self.strategy)
+        if not numpy_backend.supports(self.strategy):
+            raise ValueError(f"{self.strategy.name}: для 2D нужен модуль не больше 2^31")
+
+        self._reset_stats()
+
+    def _window_hashes(self, codes: np.ndarray, r: int, c: int) -> list:
+        # По каждому полиному - генератор (i, хеши окон строки i)
+        return [window_rows(row_hashes(codes, c, p, mod), r, pow(p, c, mod), mod)
+                for p, mod in self.params]
+
+    def _search(self, pattern, grid):
+        pattern = as_grid(pattern)
+        grid = as_grid(grid)
+        r, c = pattern.shape
+        if not r or not c or r > grid.shape[0] or c > grid.shape[1]:
+            return
+
+        # Хеш паттерна - тем же проходом по сетке из одного окна
+        pattern_hash = [next(rows)[1][0] for rows in self._window_hashes(pattern, r, c)]
+
+        for window_row in zip(*self._window_hashes(grid, r, c)):
+            i = window_row[0][0]
+            matched = np.logical_and.reduce([h == ph for (_, h), ph in zip(window_row, pattern_hash)])
+            for j in np.flatnonzero(matched).tolist():
+                self.checks += 1
+                if np.array_equal(grid[i:i + r, j:j + c], pattern):
+                    yield i, j
+                else:
+                    self.collisions += 1
+
+    def finditer(self, pattern, grid):
+        """
+        Ленивый поиск плитки pattern в сетке grid: позиции (строка, столбец)
+        левого верхнего угла, построчно. Статистика - как у RabinKarp.finditer.
+        """
+        self._reset_stats()
+        yield from self._timed_positions(self._search(pattern, grid))
+
+    def find(self, pattern, grid) -> tuple:
+        # Первое вхождение (строка, столбец) или (-1, -1)
+        return next(self.finditer(pattern, grid), (-1, -1))
+
+    def findall(self, pattern, grid) -> list:
+        return list(self.finditer(pattern, grid))
+
+    def count(self, pattern, grid) -> int:
+        return sum(1 for _ in self.finditer(pattern, grid))
@@ -0,0 +1,173 @@
+"""
+ИНДЕКС ДЛЯ ПОВТОРНЫХ ЗАПРОСОВ К НЕИЗМЕННОМУ ТЕКСТУ
+
+Для каждой длины из lengths один раз считаются хеши всех окон текста
+(векторно, src.numpy_backend) и хранятся как два массива: отсортированные
+хеши и позиции окон в том же порядке. Поиск по хешу - np.searchsorted.
+
+- длина паттерна есть в индексе: кандидаты - окна с тем же хешем;
+- паттерн длиннее: берётся самый редкий k-грамм паттерна (k - наибольшая
+  проиндексированная длина <= m), кандидаты - его позиции минус смещение;
+- паттерн короче всех длин: обычный проход RabinKarp.
+Каждый кандидат проверяется посимвольно, поэтому ответ точный.
+"""
+import json
+import zlib
+
+import numpy as np
+
+from src import numpy_backend
+from src.double_hash import double_hash
+from src.rabin_karp import RabinKarp
+from src.search_stats import SearchStats
+from src.strategies import make_strategy
+from src.verify import make_verifier
+
+
+def _text_checksum(text) -> int:
+    data = text.encode("utf-8") if isinstance(text, str) else bytes(text)
+    return zlib.crc32(data)
+
+
+class RabinKarpIndex(SearchStats):
+
+    def __init__(self, text, hash_func=double_hash, lengths=(4, 8, 16), tables: dict = None):
+        self.strategy = make_strategy(hash_func)
+        if not numpy_backend.supports(self.strategy):
+            raise ValueError(f"{self.strategy.name}: для индекса нужна векторизуемая хеш-функция")
+
+        self.text = text if isinstance(text, str) else memoryview(text).cast("B")
+        self.lengths = sorted(set(lengths))
+
+        self._reset_stats()
+
+        if tables is not None:
+            self.tables = tables
+            return
+
+        # Хеши всех окон: (отсортированные хеши, позиции окон)
+        codes = numpy_backend.encode_text(self.text)
+        hash_dtype = np.uint64 if self.strategy.width > 32 else np.uint32
+        position_dtype = np.int32 if len(codes) < 2 ** 31 else np.int64
+        self.tables = {}
+        for length in self.lengths:
+            if length > len(codes):
+                continue
+            hashes = numpy_backend.window_hashes(self.strategy, codes, length)
+            order = np.argsort(hashes, kind="stable")
+            self.tables[length] = (hashes[order].astype(hash_dtype), order.astype(position_dtype))
+
+    def _postings(self, length: int, h: int) -> np.ndarray:
+        # Позиции окон длины length с хешем h (по возрастанию)
+        hashes, positions = self.tables[length]
+        h = hashes.dtype.type(h)
+        lo = np.searchsorted(hashes, h, side="left")
+        hi = np.searchsorted(hashes, h, side="right")
+        return positions[lo:hi]
+
+    def _candidates(self, pattern) -> np.ndarray:
+        m = len(pattern)
+        if m in self.tables:
+            return self._postings(m, self.strategy(pattern))
+
+        k = max(length for length in self.tables if length <= m)
+        strategy = self.strategy
+
+        # Хеши всех k-граммов паттерна скользящим хешем
+        h, roll = strategy.init(pattern[:k])
+        kgram_hashes = [h]
+        to_code = ord if isinstance(pattern, str) else int
+        for offset in range(1, m - k + 1):
+            if roll:
+                h = roll(h, to_code(pattern[offset - 1]), to_code(pattern[offset + k - 1]))
+            else:
+                h = strategy.window_hash(pattern, offset, k)
+            kgram_hashes.append(h)
+
+        # Самый редкий k-грамм: длины списков позиций считаются одним searchsorted
+        hashes, positions = self.tables[k]
+        kgram_hashes = np.array(kgram_hashes, dtype=hashes.dtype)
+        lo = np.searchsorted(hashes, kgram_hashes, side="left")
+        hi = np.searchsorted(hashes, kgram_hashes, side="right")
+        best_offset = int(np.argmin(hi - lo))
+
+        starts = positions[lo[best_offset]:hi[best_offset]].astype(np.int64) - best_offset
+        return starts[(starts >= 0) & (starts <= len(self.text) - m)]
+
+    def finditer(self, pattern):
+        """Все вхождения за O(m + кандидаты), если длина покрыта индексом"""
+        self._reset_stats()
+        yield from self._timed_positions(self._search(pattern))
+
+    def _search(self, pattern):
+        text = self.text
+        if not isinstance(text, str) and isinstance(pattern, str):
+            pattern = pattern.encode("utf-8")
+        m = len(pattern)
+
+        if not m or m > len(text):
+            return
+
+        if not self.tables or m < min(self.tables):
+            # Короче всех проиндексированных длин - обычный скользящий поиск
+            algorithm = RabinKarp(self.strategy)
+            for position in algorithm.finditer(pattern, text):
+                self.collisions, self.checks = algorithm.collisions, algorithm.checks
+                yield position
+            self.collisions, self.checks = algorithm.collisions, algorithm.checks
+            return
+
+        verify = make_verifier(pattern, text)
+        for i in self._candidates(pattern).tolist():
+            self.checks += 1
+            if verify(i):
+                yield i
+            else:
+                self.collisions += 1
+
+    def find(self, pattern) -> int:
+        return next(self.finditer(pattern), -1)
+
+    def findall(self, pattern) -> list:
+        return list(self.finditer(pattern))
+
+    def count(self, pattern) -> int:
+        return sum(1 for _ in self.finditer(pattern))
+
+    def memory_usage(self) -> dict:
+        # Байты массивов индекса по длинам и всего
+        usage = {length: hashes.nbytes + positions.nbytes
+                 for length, (hashes, positions) in self.tables.items()}
+        usage["total"] = sum(usage.values())
+        return usage
+
+    def save(self, path: str):
+        """Массивы индекса в .npz; сам текст не сохраняется, только его длина и CRC32"""
+        arrays = {}
+        for length, (hashes, positions) in self.tables.items():
+            arrays[f"hashes_{length}"] = hashes
+            arrays[f"positions_{length}"] = positions
+        meta = {
+            "strategy": self.strategy.name,
+            "lengths": self.lengths,
+            "text_length": len(self.text),
+            "text_crc32": _text_checksum(self.text),
+        }
+        np.savez(path, meta=np.array(json.dumps(meta)), **arrays)
+
+    @classmethod
+    def load(cls, path: str, text, hash_func=double_hash):
+        # Индекс подходит только к тому же тексту и той же хеш-функции
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            tables = {}
+            for length in meta["lengths"]:
+                if f"hashes_{length}" in data:
+                    tables[length] = (data[f"hashes_{length}"], data[f"positions_{length}"])
+
+        index = cls(text, hash_func, meta["lengths"], tables=tables)
+        if meta["strategy"] != index.strategy.name:
+            raise ValueError(f"Индекс построен для {meta['strategy']}, а не {index.strategy.name}")
+        if meta["text_length"] != len(index.text) or meta["text_crc32"] != _text_checksum(index.text):
+            raise ValueError("Индекс построен для другого текста")
+        return index
@@ -0,0 +1,42 @@
+"""
+СТАТИСТИКА ПОИСКА
+
+Общая часть всех объектов поиска (RabinKarp, MultiPatternRabinKarp,
+RabinKarpIndex, SuffixArraySearch, ParallelRabinKarp, RabinKarp2D,
+WinnowingDetector, SubstringMatch): счётчики collisions / checks / time_ns
+и get_stats() с одинаковыми полями.
+__slots__ пуст - классы со __slots__ объявляют collisions, checks, time_ns сами.
+"""
+import time
+
+
+class SearchStats:
+    __slots__ = ()
+
+    def _reset_stats(self):
+        # Перед каждым новым поиском
+        self.collisions = 0
+        self.checks = 0
+        self.time_ns = 0
+
+    def _timed_positions(self, positions):
+        """
+        Отдаёт результаты генератора positions, копя в time_ns только время
+        поиска: пока вызывающий код обрабатывает очередную позицию, часы стоят
+        """
+        start_time = time.perf_counter_ns()
+        for position in positions:
+            self.time_ns += time.perf_counter_ns() - start_time
+            yield position
+            start_time = time.perf_counter_ns()
+
+        self.time_ns += time.perf_counter_ns() - start_time
+
+    def get_stats(self) -> dict:
+        return {
+            "collisions": self.collisions,
+            "checks": self.checks,
+            "time_ns": self.time_ns,
+            "time_ms": self.time_ns / 1_000_000,
+            "time_sec": self.time_ns / 1_000_000_000
+        }
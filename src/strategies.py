@@ -0,0 +1,35 @@
+from src.chetsum_hash import chetsum_hash, ChetSumHashStrategy
+from src.dna_hash import dna_hash, DNAHashStrategy
+from src.double_hash import double_hash, DoubleHashStrategy
+from src.first_last_hash import first_last_hash, FirstLastHashStrategy
+from src.hash_simple import simple_hash, SimpleHashStrategy
+from src.hash_strategy import HashStrategy, FunctionStrategy
+from src.linear_search import linear_search, LinearSearchStrategy
+from src.lite_crc32 import rolling_crc32, LiteCRC32Strategy
+
+# Функция хеширования -> класс стратегии
+STRATEGIES = {
+    simple_hash: SimpleHashStrategy,
+    chetsum_hash: ChetSumHashStrategy,
+    first_last_hash: FirstLastHashStrategy,
+    rolling_crc32: LiteCRC32Strategy,
+    double_hash: DoubleHashStrategy,
+    linear_search: LinearSearchStrategy,
+    dna_hash: DNAHashStrategy,
+}
+
+
+def make_strategy(hash_func, hash_name: str = "") -> HashStrategy:
+    """
+    Возвращает стратегию для функции хеширования: готовая стратегия - как есть,
+    для известных функций - новый экземпляр. Состояние скольжения живёт в roll
+    из strategy.init, поэтому один экземпляр годится для нескольких проходов.
+    """
+    if isinstance(hash_func, HashStrategy):
+        return hash_func
+
+    strategy_cls = STRATEGIES.get(hash_func)
+    if strategy_cls is not None:
+        return strategy_cls()
+
+    return FunctionStrategy(hash_func, hash_name)
@@ -0,0 +1,175 @@
+"""
+СУФФИКСНЫЙ МАССИВ ДЛЯ НЕИЗМЕННЫХ ТЕКСТОВ
+
+Суффиксный массив строится один раз удвоением префиксов (сортировка пар
+рангов в NumPy, O(n log^2 n)); по желанию - LCP-массив (алгоритм Касаи).
+Запрос - два бинарных поиска по суффиксам: O(m log n) независимо от длины
+текста, что выгодно для длинных паттернов и многих запросов к одному тексту.
+
+Счётчики как в RabinKarp.get_stats: checks - число сравнений паттерна
+с суффиксом, collisions всегда 0 (хешей нет).
+"""
+import time
+
+import numpy as np
+
+from src.double_hash import double_hash
+from src.numpy_backend import encode_text
+from src.rabin_karp import RabinKarp
+from src.search_stats import SearchStats
+
+# Построение суффиксного массива стоит примерно столько проходов RabinKarp
+# с double_hash. Замер results/suffix_array/suffix_array_graph_data.py (медиана
+# из 3): war_and_peace 1.9, alice 2.1, dna 3.4 (у ДНК больше раундов удвоения),
+# короткие тексты 0.6-1.1; берётся медиана по корпусу. Отношение зависит от
+# текста, поэтому select_engine принимает свой порог в build_passes
+SUFFIX_ARRAY_BUILD_PASSES = 2
+
+
+def build_suffix_array(codes: np.ndarray) -> np.ndarray:
+    # Удвоение префиксов: ранг суффикса по первым 2k символам из пары рангов по k
+    n = len(codes)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    _, rank = np.unique(codes, return_inverse=True)
+    rank = rank.astype(np.int64) + 1
+    sa = np.argsort(rank, kind="stable")
+    k = 1
+    while k < n:
+        second = np.zeros(n, dtype=np.int64)
+        second[:n - k] = rank[k:]
+        key = rank * (n + 1) + second
+        sa = np.argsort(key, kind="stable")
+        sorted_key = key[sa]
+        new_rank = np.empty(n, dtype=np.int64)
+        new_rank[sa] = np.concatenate(([1], 1 + np.cumsum(sorted_key[1:] != sorted_key[:-1])))
+        rank = new_rank
+        if rank.max() == n:
+            break
+        k *= 2
+    return sa
+
+
+def build_lcp(text, sa: np.ndarray) -> np.ndarray:
+    # Касаи: lcp[i] - длина общего префикса суффиксов sa[i-1] и sa[i]
+    n = len(sa)
+    rank = np.empty(n, dtype=np.int64)
+    rank[sa] = np.arange(n)
+    rank = rank.tolist()
+    suffixes = sa.tolist()
+    lcp = [0] * n
+    h = 0
+    for i in range(n):
+        r = rank[i]
+        if r > 0:
+            j = suffixes[r - 1]
+            while i + h < n and j + h < n and text[i + h] == text[j + h]:
+                h += 1
+            lcp[r] = h
+            if h:
+                h -= 1
+        else:
+            h = 0
+    return np.array(lcp, dtype=np.int64)
+
+
+class SuffixArraySearch(SearchStats):
+
+    def __init__(self, text, with_lcp: bool = False):
+        # bytes, а не memoryview: суффиксы сравниваются через <
+        self.text = text if isinstance(text, str) else bytes(text)
+        self.hash_name = "suffix_array"
+
+        start_time = time.perf_counter_ns()
+        self.sa = build_suffix_array(encode_text(self.text))
+        self.lcp = build_lcp(self.text, self.sa) if with_lcp else None
+        self.build_time_ns = time.perf_counter_ns() - start_time
+
+        self._reset_stats()
+
+    def _bound(self, pattern, upper: bool) -> int:
+        # Первый суффикс, чей префикс длины m больше (upper) или не меньше паттерна
+        text, sa, m = self.text, self.sa, len(pattern)
+        lo, hi = 0, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            i = int(sa[mid])
+            prefix = text[i:i + m]
+            self.checks += 1
+            if prefix < pattern or (upper and prefix == pattern):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _range(self, pattern) -> tuple:
+        self._reset_stats()
+        if not isinstance(self.text, str) and isinstance(pattern, str):
+            pattern = pattern.encode("utf-8")
+        if not pattern or len(pattern) > len(self.text):
+            return 0, 0
+        return self._bound(pattern, False), self._bound(pattern, True)
+
+    def _timed(self, func):
+        start_time = time.perf_counter_ns()
+        result = func()
+        self.time_ns = time.perf_counter_ns() - start_time
+        return result
+
+    def count(self, pattern) -> int:
+        def run():
+            lo, hi = self._range(pattern)
+            return hi - lo
+        return self._timed(run)
+
+    def findall(self, pattern) -> list:
+        # Позиции по возрастанию
+        def run():
+            lo, hi = self._range(pattern)
+            return np.sort(self.sa[lo:hi]).tolist()
+        return self._timed(run)
+
+    def finditer(self, pattern):
+        yield from self.findall(pattern)
+
+    def find(self, pattern) -> int:
+        def run():
+            lo, hi = self._range(pattern)
+            return int(self.sa[lo:hi].min()) if hi > lo else -1
+        return self._timed(run)
+
+
+class RabinKarpSearcher:
+    """RabinKarp, привязанный к тексту: тот же интерфейс, что у SuffixArraySearch"""
+
+    def __init__(self, text, hash_func=double_hash):
+        self.text = text
+        self.algorithm = RabinKarp(hash_func)
+        self.hash_name = self.algorithm.hash_name
+
+    def find(self, pattern) -> int:
+        return self.algorithm.find(pattern, self.text)
+
+    def findall(self, pattern) -> list:
+        return self.algorithm.findall(pattern, self.text)
+
+    def finditer(self, pattern):
+        return self.algorithm.finditer(pattern, self.text)
+
+    def count(self, pattern) -> int:
+        return self.algorithm.count(pattern, self.text)
+
+    def get_stats(self) -> dict:
+        return self.algorithm.get_stats()
+
+
+def select_engine(text, expected_queries: int = 1, hash_func=double_hash,
+                  build_passes: float = SUFFIX_ARRAY_BUILD_PASSES):
+    """
+    Выбор движка по числу ожидаемых запросов к тексту: суффиксный массив
+    окупается, когда запросов больше, чем проходов RabinKarp стоит его построение.
+    """
+    if expected_queries > build_passes:
+        return SuffixArraySearch(text)
+    return RabinKarpSearcher(text, hash_func)
@@ -0,0 +1,176 @@
+"""
+ДИСКОВЫЙ КЕШ ТЕКСТОВ И ПРЕДПОСЧИТАННЫХ МАССИВОВ
+
+Каталог кеша адресуется содержимым: для каждого файла считается sha256,
+массивы лежат в <cache_dir>/<sha256>/<имя>.npy. Чтобы не хешировать файл
+при каждом запуске, index.json помнит (размер, mtime) -> sha256 по пути.
+
+Хранится:
+- codes.npy - коды символов текста (uint32), из них восстанавливается str
+  без повторного определения кодировки и декодирования;
+- poly_prefix_<p>_<mod>.npy / poly_powers_<p>_<mod>.npy - префиксный хеш
+  и степени для полиномиальных хешей (src.numpy_backend.polynomial_prefix),
+  по ним src.longest_substring считает хеши окон файла.
+Массивы открываются через np.load(mmap_mode="r"); при превышении max_bytes
+удаляются записи, к которым дольше всего не обращались.
+"""
+import codecs
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+from src import numpy_backend
+
+CACHE_DIR = os.path.join(".cache", "texts")
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+
+_BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+def decode_text(data: bytes) -> str:
+    """
+    Текст файла: кодировка по BOM; без BOM - utf-8, а если байты не образуют
+    корректный utf-8 - latin-1 (декодирует любые байты). Байты декодируются
+    один раз: проверкой utf-8 служит само декодирование.
+    """
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return data.decode(encoding)
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("latin-1")
+
+
+def _dir_size(path: str) -> int:
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+class TextCache:
+
+    def __init__(self, cache_dir: str = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._index_path = os.path.join(cache_dir, "index.json")
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: dict):
+        tmp = self._index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp, self._index_path)
+
+    def digest(self, path: str) -> str:
+        # sha256 содержимого; пересчитывается, только если изменились размер или mtime
+        os.makedirs(self.cache_dir, exist_ok=True)
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        index = self._load_index()
+        entry = index.get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                sha.update(block)
+        index[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha.hexdigest()}
+        self._save_index(index)
+        return sha.hexdigest()
+
+    def _array(self, path: str, name: str, builder) -> np.ndarray:
+        entry_dir = os.path.join(self.cache_dir, self.digest(path))
+        file_path = os.path.join(entry_dir, name + ".npy")
+        if os.path.exists(file_path):
+            os.utime(entry_dir)  # отметка последнего использования для вытеснения
+            return np.load(file_path, mmap_mode="r")
+
+        array = builder()
+        os.makedirs(entry_dir, exist_ok=True)
+        tmp = os.path.join(entry_dir, name + ".tmp.npy")
+        np.save(tmp, array)
+        os.replace(tmp, file_path)
+        self._evict(keep=entry_dir)
+        return np.load(file_path, mmap_mode="r")
+
+    def _evict(self, keep: str):
+        # Удаляем самые давно использованные записи, пока кеш больше max_bytes
+        entries = [entry for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+        sizes = {entry.path: _dir_size(entry.path) for entry in entries}
+        total = sum(sizes.values())
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+            if total <= self.max_bytes:
+                break
+            if entry.path == keep:
+                continue
+            shutil.rmtree(entry.path, ignore_errors=True)
+            total -= sizes[entry.path]
+
+    def codes(self, path: str) -> np.ndarray:
+        """Коды символов файла (uint32, только чтение)"""
+        def build():
+            with open(path, "rb") as f:
+                text = decode_text(f.read())
+            return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        return self._array(path, "codes", build)
+
+    def text(self, path: str) -> str:
+        return self.codes(path).tobytes().decode("utf-32-le")
+
+    def polynomial_arrays(self, path: str, p: int, mod: int) -> tuple:
+        """(prefix, powers) полиномиального хеша с параметрами p, mod (только чтение)"""
+        arrays = []
+
+        def build(part: int):
+            # Оба массива считаются одним вызовом polynomial_prefix
+            def run():
+                if not arrays:
+                    arrays.extend(numpy_backend.polynomial_prefix(
+                        self.codes(path).astype(np.int64), p, mod))
+                return arrays[part]
+            return run
+
+        prefix = self._array(path, f"poly_prefix_{p}_{mod}", build(0))
+        pw = self._array(path, f"poly_powers_{p}_{mod}", build(1))
+        return prefix, pw
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+_default_cache = TextCache()
+
+# Тексты, уже загруженные в этом процессе: путь -> (размер, mtime, текст)
+_loaded = {}
+
+
+def load_text(path: str) -> str:
+    """Текст корпуса; декодируется один раз на процесс (и один раз на диске)"""
+    key = os.path.abspath(path)
+    stat = os.stat(path)
+    cached = _loaded.get(key)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+    text = _default_cache.text(path)
+    _loaded[key] = (stat.st_size, stat.st_mtime_ns, text)
+    return text
+
+
+def load_polynomial_arrays(path: str, p: int, mod: int) -> tuple:
+    return _default_cache.polynomial_arrays(path, p, mod)
@@ -0,0 +1,37 @@
+"""
+ПРОВЕРКА КАНДИДАТОВ БЕЗ КОПИРОВАНИЯ
+
+Совпадение хешей проверяется без среза text[i:i + m] (копия m символов):
+- str: text.startswith(pattern, i) - сравнение на месте;
+- bytes-подобный текст (memoryview): срез memoryview не копирует данные.
+Перед полным сравнением - дешёвый отсев по последнему и среднему символам
+(первый символ сравнивает полное сравнение в самом начале). Результат
+всегда совпадает с text[i:i + m] == pattern, поэтому счётчики коллизий точны.
+"""
+
+# Короче этого отсев по символам не окупается - сразу полное сравнение
+PRECHECK_MIN_LENGTH = 4
+
+
+def make_verifier(pattern, text):
+    """verify(i) -> True, если окно text[i:i + len(pattern)] равно паттерну"""
+    m = len(pattern)
+    end, half = m - 1, m // 2
+    last, middle = pattern[end], pattern[half]
+
+    if isinstance(text, str):
+        startswith = text.startswith
+        if m < PRECHECK_MIN_LENGTH:
+            return lambda i: startswith(pattern, i)
+
+        def verify(i: int) -> bool:
+            return text[i + end] == last and text[i + half] == middle and startswith(pattern, i)
+        return verify
+
+    # memoryview(...).cast("B"): text[i] и pattern[k] - int
+    if m < PRECHECK_MIN_LENGTH:
+        return lambda i: text[i:i + m] == pattern
+
+    def verify_bytes(i: int) -> bool:
+        return text[i + end] == last and text[i + half] == middle and text[i:i + m] == pattern
+    return verify_bytes
@@ -0,0 +1,165 @@
+"""
+ОБЩИЕ ФРАГМЕНТЫ ДОКУМЕНТОВ: WINNOWING
+
+1. Хеши всех окон длины k каждого документа - полиномиальный хеш
+   (double_hash по умолчанию), векторно через src.numpy_backend.
+2. Winnowing: в каждой группе из w подряд идущих окон берётся окно с
+   минимальным хешем (при равенстве - самое правое); отпечаток документа -
+   множество выбранных (хеш, позиция), примерно 2 / (w + 1) от числа окон.
+   Общий фрагмент длины >= w + k - 1 гарантированно даёт общий отпечаток.
+3. Отпечатки всех документов сортируются по хешу одним массивом (sorted-merge
+   join): пары с одинаковым хешем из разных документов - кандидаты. Кандидат
+   проверяется сравнением окон (checks / collisions) и расширяется влево и
+   вправо до максимального совпадающего фрагмента.
+Время - O(размер корпуса * w) векторно плюс O(F log F) на F отпечатков и
+O(длина найденного) на проверки: почти линейно по размеру корпуса (пока
+хеш не повторяется в сотнях мест - у группы из g отпечатков g^2 пар).
+"""
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from src import numpy_backend
+from src.double_hash import double_hash
+from src.search_stats import SearchStats
+from src.strategies import make_strategy
+
+# Длина окна и размер группы winnowing по умолчанию: гарантированно
+# находятся общие фрагменты от WINDOW + GROUP - 1 = 79 символов
+WINDOW = 50
+GROUP = 30
+
+
+@dataclass(slots=True)
+class SharedRegion:
+    """Совпадающий фрагмент: text_a[start_a:start_a + length] == text_b[start_b:start_b + length]"""
+    doc_a: str
+    start_a: int
+    doc_b: str
+    start_b: int
+    length: int
+
+
+def winnow(hashes: np.ndarray, w: int) -> np.ndarray:
+    """Позиции окон-отпечатков (по возрастанию): минимум в каждой группе из w окон"""
+    w = min(w, len(hashes))
+    groups = np.lib.stride_tricks.sliding_window_view(hashes, w)
+    # argmin по перевёрнутым группам - самое правое из равных минимумов
+    chosen = np.arange(len(groups)) + (w - 1 - np.argmin(groups[:, ::-1], axis=1))
+    return np.unique(chosen)
+
+
+class WinnowingDetector(SearchStats):
+
+    def __init__(self, hash_func=double_hash, k: int = WINDOW, w: int = GROUP):
+        self.strategy = make_strategy(hash_func)
+        if not numpy_backend.supports(self.strategy):
+            raise ValueError(f"{self.strategy.name}: нужна векторизуемая хеш-функция")
+        self.k = k
+        self.w = w
+
+        # имя документа -> (текст, хеши отпечатков, позиции отпечатков)
+        self.documents = {}
+
+        self._reset_stats()
+        self.fingerprint_ns = 0
+
+    def add(self, name: str, text):
+        """Добавить документ (str или bytes): считаются только его отпечатки"""
+        if name in self.documents:
+            raise ValueError(f"Документ {name!r} уже добавлен")
+        start_time = time.perf_counter_ns()
+        if not isinstance(text, str):
+            text = memoryview(text).cast("B")
+
+        codes = numpy_backend.encode_text(text)
+        if len(codes) < self.k:
+            positions = np.zeros(0, dtype=np.int64)
+            hashes = np.zeros(0, dtype=np.int64)
+        else:
+            window_hashes = numpy_backend.window_hashes(self.strategy, codes, self.k)
+            positions = winnow(window_hashes, self.w)
+            hashes = window_hashes[positions]
+        self.documents[name] = (text, hashes, positions)
+        self.fingerprint_ns += time.perf_counter_ns() - start_time
+
+    def fingerprint_count(self) -> int:
+        return sum(len(hashes) for _, hashes, _ in self.documents.values())
+
+    def _candidate_pairs(self, self_matches: bool):
+        # Пары отпечатков с одинаковым хешем: (документ a, позиция a, документ b, позиция b)
+        names = list(self.documents)
+        hashes = np.concatenate([self.documents[name][1] for name in names] or [np.zeros(0, np.int64)])
+        positions = np.concatenate([self.documents[name][2] for name in names] or [np.zeros(0, np.int64)])
+        doc_ids = np.concatenate([np.full(len(self.documents[name][1]), index)
+                                  for index, name in enumerate(names)] or [np.zeros(0, np.int64)])
+
+        order = np.argsort(hashes, kind="stable")
+        hashes, positions, doc_ids = hashes[order], positions[order], doc_ids[order]
+
+        # Границы групп одинаковых хешей; одиночные группы отпечатков общих фрагментов не дают
+        bounds = np.flatnonzero(np.diff(hashes)) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [len(hashes)]))
+        shared = np.flatnonzero(ends - starts > 1)
+
+        for group in shared.tolist():
+            members = list(zip(doc_ids[starts[group]:ends[group]].tolist(),
+                               positions[starts[group]:ends[group]].tolist()))
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    (doc_a, pos_a), (doc_b, pos_b) = sorted((members[x], members[y]))
+                    if doc_a != doc_b or (self_matches and pos_a != pos_b):
+                        yield names[doc_a], pos_a, names[doc_b], pos_b
+
+    def shared_regions(self, self_matches: bool = False) -> list:
+        """
+        Максимальные совпадающие фрагменты между документами (self_matches=True -
+        и повторы внутри одного документа), по документам и позициям
+        """
+        self._reset_stats()
+        start_time = time.perf_counter_ns()
+
+        k = self.k
+        # (документ a, документ b, диагональ start_b - start_a) -> найденные фрагменты
+        found = {}
+        regions = []
+        for doc_a, pos_a, doc_b, pos_b in sorted(self._candidate_pairs(self_matches)):
+            text_a, text_b = self.documents[doc_a][0], self.documents[doc_b][0]
+
+            # Отпечаток внутри уже найденного фрагмента той же диагонали
+            diagonal = found.setdefault((doc_a, doc_b, pos_b - pos_a), [])
+            if diagonal and pos_a < diagonal[-1].start_a + diagonal[-1].length:
+                continue
+
+            self.checks += 1
+            if text_a[pos_a:pos_a + k] != text_b[pos_b:pos_b + k]:
+                self.collisions += 1
+                continue
+
+            start_a, start_b, end_a = pos_a, pos_b, pos_a + k
+            while start_a and start_b and text_a[start_a - 1] == text_b[start_b - 1]:
+                start_a -= 1
+                start_b -= 1
+            end_b = start_b + end_a - start_a
+            while end_a < len(text_a) and end_b < len(text_b) and text_a[end_a] == text_b[end_b]:
+                end_a += 1
+                end_b += 1
+
+            region = SharedRegion(doc_a, start_a, doc_b, start_b, end_a - start_a)
+            diagonal.append(region)
+            regions.append(region)
+
+        self.time_ns = time.perf_counter_ns() - start_time
+        regions.sort(key=lambda region: (region.doc_a, region.doc_b, region.start_a, region.start_b))
+        return regions
+
+    def get_stats(self) -> dict:
+        # Поля RabinKarp.get_stats (время - последнего shared_regions), время и число отпечатков
+        return {
+            **super().get_stats(),
+            "documents": len(self.documents),
+            "fingerprints": self.fingerprint_count(),
+            "fingerprint_ms": self.fingerprint_ns / 1_000_000,
+        }
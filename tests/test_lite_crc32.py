@@ -0,0 +1,63 @@
+import random
+import zlib
+
+import pytest
+
+from src.lite_crc32 import LiteCRC32Strategy, rolling_crc32
+from src.rabin_karp import RabinKarp
+
+# rolling_crc32 - CRC32 без начального 0xFFFFFFFF и финального XOR:
+#   rolling_crc32(w, 0xFFFFFFFF) ^ 0xFFFFFFFF == zlib.crc32(w)
+#   rolling_crc32(w)                          == zlib.crc32(w) ^ zlib.crc32(bytes(len(w)))
+INIT = 0xFFFFFFFF
+XOR_OUT = 0xFFFFFFFF
+
+
+def zlib_convention(h: int, m: int) -> int:
+    # Хеш окна без init / xorout -> стандартный CRC32 того же окна
+    return h ^ zlib.crc32(bytes(m))
+
+
+def test_whole_string_matches_zlib():
+    for data in (b"", b"a", b"123456789", bytes(range(256))):
+        assert rolling_crc32(data, INIT) ^ XOR_OUT == zlib.crc32(data)
+        assert zlib_convention(rolling_crc32(data), len(data)) == zlib.crc32(data)
+    assert zlib.crc32(b"123456789") == 0xCBF43926
+
+
+@pytest.mark.parametrize("m", [1, 4, 16, 100])
+def test_rolled_windows_match_zlib(m):
+    data = random.Random(m).randbytes(2000)
+    h, roll = LiteCRC32Strategy().init(data[:m])
+    for i in range(len(data) - m + 1):
+        if i:
+            h = roll(h, data[i - 1], data[i + m - 1])
+        assert zlib_convention(h, m) == zlib.crc32(data[i:i + m])
+
+
+def test_str_windows_match_zlib_of_latin1():
+    # Коды символов < 256 - те же байты, что и в latin-1
+    text = "Crème brûlée à la carte, s'il vous plaît. " * 20
+    m = 12
+    h, roll = LiteCRC32Strategy().init(text[:m])
+    for i in range(1, len(text) - m + 1):
+        h = roll(h, ord(text[i - 1]), ord(text[i + m - 1]))
+        assert zlib_convention(h, m) == zlib.crc32(text[i:i + m].encode("latin-1"))
+
+
+def test_search_over_bytes_counts_no_collisions_for_distinct_windows():
+    data = bytes(range(256)) * 4
+    rk = RabinKarp(rolling_crc32)
+    assert rk.findall(bytes(range(10, 20)), data) == [10, 266, 522, 778]
+    assert rk.get_stats()["collisions"] == 0
+
+
+def test_wide_codes_roll_like_rehash():
+    # Коды >= 256 (кириллица) в zlib не выражаются - сверяем скольжение с пересчётом окна
+    text = "Война и мир — Наташа Ростова. " * 10
+    m = 9
+    strategy = LiteCRC32Strategy()
+    h, roll = strategy.init(text[:m])
+    for i in range(1, len(text) - m + 1):
+        h = roll(h, ord(text[i - 1]), ord(text[i + m - 1]))
+        assert h == rolling_crc32(text[i:i + m])
@@ -0,0 +1,27 @@
+from src.longest_substring import (longest_common_substring, longest_common_substring_in_files,
+                                   longest_repeated_substring, longest_repeated_substring_in_file)
+
+TEXT_A = "the quick brown fox jumps over the lazy dog; a quick brown cat "
+TEXT_B = "lazy dogs and a quick brown fox"
+
+
+def test_repeated_substring():
+    match = longest_repeated_substring(TEXT_A)
+    assert TEXT_A[match.start_a:match.start_a + match.length] == " quick brown "
+    assert match.start_a < match.start_b
+    assert TEXT_A[match.start_b:match.start_b + match.length] == " quick brown "
+
+
+def test_file_versions_match_text_versions(tmp_path):
+    path_a, path_b = tmp_path / "a.txt", tmp_path / "b.txt"
+    path_a.write_text(TEXT_A, encoding="utf-8")
+    path_b.write_text(TEXT_B, encoding="utf-8")
+
+    expected = longest_repeated_substring(TEXT_A)
+    match = longest_repeated_substring_in_file(str(path_a))
+    assert (match.length, match.start_a, match.start_b) == (expected.length, expected.start_a, expected.start_b)
+
+    expected = longest_common_substring(TEXT_A, TEXT_B)
+    match = longest_common_substring_in_files(str(path_a), str(path_b))
+    assert (match.length, match.start_a, match.start_b) == (expected.length, expected.start_a, expected.start_b)
+    assert TEXT_B[match.start_b:match.start_b + match.length] == " quick brown fox"
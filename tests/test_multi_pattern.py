@@ -0,0 +1,41 @@
+import pytest
+
+from src.double_hash import double_hash
+from src.hash_simple import simple_hash
+from src.multi_pattern import MultiPatternRabinKarp
+
+PATTERNS = ["abc", "bca", "cab", "война", "мир", b"xab"]
+TEXT = "xxabcabca война и мир, xabc"
+
+
+def naive(patterns, text):
+    hits = []
+    for pattern_id, pattern in enumerate(patterns):
+        if isinstance(text, bytes) and isinstance(pattern, str):
+            pattern = pattern.encode("utf-8")
+        if isinstance(text, str) and isinstance(pattern, bytes):
+            continue
+        hits += [(len(pattern), i, pattern_id) for i in range(len(text) - len(pattern) + 1)
+                 if text.startswith(pattern, i)]
+    return [(pattern_id, i) for _, i, pattern_id in sorted(hits)]
+
+
+@pytest.mark.parametrize("hash_func", [double_hash, simple_hash], ids=lambda f: f.__name__)
+def test_bytes_text_matches_str_patterns(hash_func):
+    data = TEXT.encode("utf-8")
+    multi = MultiPatternRabinKarp(hash_func, PATTERNS)
+    assert sorted(multi.findall(data)) == sorted(naive(PATTERNS, data))
+    assert multi.get_stats()["checks"] >= len(naive(PATTERNS, data))
+
+
+def test_str_pattern_found_in_bytes_text():
+    multi = MultiPatternRabinKarp(double_hash, ["abc"])
+    assert multi.findall(b"xxabc") == [(0, 2)]
+    assert multi.get_stats()["collisions"] == 0
+
+
+def test_str_and_bytes_on_one_object():
+    str_patterns = PATTERNS[:-1]
+    multi = MultiPatternRabinKarp(double_hash, str_patterns)
+    assert sorted(multi.findall(TEXT)) == sorted(naive(str_patterns, TEXT))
+    assert sorted(multi.findall(bytearray(TEXT.encode()))) == sorted(naive(str_patterns, TEXT.encode()))
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from src import numpy_backend
+from src.hash_strategy import PolynomialStrategy
+from src.rabin_karp import RabinKarp
+from src.strategies import STRATEGIES, make_strategy
+
+TEXT = "Война и мир. " * 40 + "abracadabra"
+
+
+def python_window_hashes(strategy, text, m):
+    return [strategy(text[i:i + m]) for i in range(len(text) - m + 1)]
+
+
+@pytest.mark.parametrize("strategy", [make_strategy(f) for f, cls in STRATEGIES.items()
+                                      if numpy_backend.supports(cls())]
+                         + [PolynomialStrategy(131, (1 << 31) - 1)], ids=lambda s: s.name)
+def test_window_hashes_match_python(strategy):
+    for m in (1, 7, 40):
+        hashes = numpy_backend.window_hashes(strategy, numpy_backend.encode_text(TEXT), m)
+        assert hashes.tolist() == python_window_hashes(strategy, TEXT, m)
+
+
+def test_large_modulus_not_vectorized():
+    strategy = PolynomialStrategy(131, (1 << 61) - 1)
+    assert not numpy_backend.supports(strategy)
+    assert numpy_backend.supports(PolynomialStrategy(131, numpy_backend.MAX_MOD))
+
+    # backend="numpy" остаётся на Python и находит то же, что и наивный поиск
+    rk = RabinKarp(strategy, backend="numpy")
+    assert rk.backend == "python"
+    expected = [i for i in range(len(TEXT)) if TEXT.startswith("мир", i)]
+    assert rk.findall("мир", TEXT) == expected
+    assert rk.get_stats()["collisions"] == 0
+
+
+def test_numpy_backend_matches_python():
+    text = TEXT.encode()
+    for hash_func in STRATEGIES:
+        if not numpy_backend.supports(make_strategy(hash_func)) and not make_strategy(hash_func).brute_force:
+            continue
+        assert (RabinKarp(hash_func, backend="numpy").findall("мир", text)
+                == RabinKarp(hash_func).findall("мир", text))
+    assert np.array_equal(numpy_backend.encode_text(b"ab"), [97, 98])
@@ -0,0 +1,23 @@
+from src.double_hash import double_hash
+from src.parallel_search import ParallelRabinKarp
+from src.rabin_karp import RabinKarp
+
+TEXT = "Наташа и Пьер. " * 2000
+
+
+def test_parallel_matches_serial():
+    serial = RabinKarp(double_hash)
+    expected = serial.findall("Пьер", TEXT)
+    parallel = ParallelRabinKarp(double_hash, workers=2, shards=5)
+
+    assert parallel.findall("Пьер", TEXT) == expected
+    assert parallel.get_stats()["checks"] == serial.get_stats()["checks"]
+    assert parallel.findall("Пьер", TEXT.encode()) == serial.findall("Пьер", TEXT.encode())
+    assert parallel.find("Пьер", TEXT) == expected[0]
+
+
+def test_time_includes_text_setup():
+    parallel = ParallelRabinKarp(double_hash, workers=2)
+    parallel.findall("Пьер", TEXT)
+    stats = parallel.get_stats()
+    assert 0 < stats["setup_ns"] < stats["time_ns"]
@@ -0,0 +1,62 @@
+import io
+import random
+
+from src.double_hash import double_hash
+from src.rabin_karp import RabinKarp, read_chunks
+
+TEXT = "abracadabra, abracadabra! " * 50
+
+
+def naive(pattern, text):
+    return [i for i in range(len(text) - len(pattern) + 1) if text.startswith(pattern, i)]
+
+
+def test_stream_matches_finditer():
+    rk = RabinKarp(double_hash)
+    expected = naive("cadab", TEXT)
+    assert list(rk.finditer_stream("cadab", read_chunks(io.StringIO(TEXT), 7))) == expected
+    assert list(rk.finditer_stream("cadab", read_chunks(io.BytesIO(TEXT.encode()), 7))) == expected
+
+
+def test_stream_resets_stats_of_previous_search():
+    rk = RabinKarp(double_hash)
+    rk.findall_approx("abrakadabra", TEXT, 1)
+    assert rk.get_stats()["approx_candidates"] > 0
+
+    list(rk.finditer_stream("cadab", [TEXT]))
+    stats = rk.get_stats()
+    assert "approx_candidates" not in stats
+    assert stats["checks"] == len(naive("cadab", TEXT))
+
+
+def test_auto_stats_do_not_leak_into_next_search():
+    rk = RabinKarp("auto")
+    rk.findall("cadab", TEXT)
+    assert "auto_hash" in rk.get_stats()
+
+    # Пустой текст: выбора функции не было - и прошлого выбора в статистике нет
+    assert rk.findall("cadab", "") == []
+    assert "auto_hash" not in rk.get_stats()
+
+
+
+def test_auto_scan_keeps_instance_strategy():
+    # Анаграммы паттерна: simple_hash перерасходует бюджет, проход переходит на double_hash.
+    # Выбор живёт в проходе: два незавершённых finditer не мешают друг другу
+    rnd = random.Random(1)
+    pattern = "".join(chr(rnd.randrange(0x400, 0x800)) for _ in range(20))
+    parts = []
+    for k in range(3000):
+        parts.append("".join(chr(rnd.randrange(0x400, 0x800)) for _ in range(30)))
+        parts.append("".join(rnd.sample(pattern, len(pattern))))
+        if k % 500 == 0:
+            parts.append(pattern)
+    text = "".join(parts)
+
+    rk = RabinKarp("auto")
+    strategy = rk.strategy
+    first, second = rk.finditer(pattern, text), rk.finditer(pattern[:3], text)
+    pairs = list(zip(first, second))
+    assert rk.get_stats()["auto_switches"] >= 1
+    assert pairs == list(zip(naive(pattern, text), naive(pattern[:3], text)))
+    assert rk.strategy is strategy and rk.hash_func is strategy
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from src.double_hash import double_hash
+from src.hash_strategy import PolynomialStrategy
+from src.rabin_karp_2d import RabinKarp2D
+
+rng = np.random.default_rng(7)
+GRID = rng.integers(0, 3, size=(40, 40))
+TILE = GRID[10:20, 5:25].copy()
+STRATEGIES = [double_hash, PolynomialStrategy(), PolynomialStrategy(p=2 ** 40 + 15, mod=10 ** 9 + 7)]
+
+
+def naive(pattern, grid):
+    r, c = pattern.shape
+    return [(i, j) for i in range(grid.shape[0] - r + 1) for j in range(grid.shape[1] - c + 1)
+            if np.array_equal(grid[i:i + r, j:j + c], pattern)]
+
+
+def as_rows(grid) -> list:
+    return ["".join("abc"[code] for code in row) for row in grid]
+
+
+@pytest.mark.parametrize("hash_func", STRATEGIES, ids=["double_hash", "polynomial", "polynomial_big_p"])
+def test_codes_match_naive(hash_func):
+    expected = naive(TILE, GRID)
+    assert (10, 5) in expected
+    assert RabinKarp2D(hash_func).findall(TILE, GRID) == expected
+    assert RabinKarp2D(hash_func).findall(GRID[:2, :3], GRID) == naive(GRID[:2, :3], GRID)
+
+
+@pytest.mark.parametrize("hash_func", STRATEGIES, ids=["double_hash", "polynomial", "polynomial_big_p"])
+def test_str_rows_and_char_arrays(hash_func):
+    expected = naive(TILE, GRID)
+    rows, tile_rows = as_rows(GRID), as_rows(TILE)
+    engine = RabinKarp2D(hash_func)
+    assert engine.findall(tile_rows, rows) == expected
+    assert engine.findall(np.array([list(row) for row in tile_rows]),
+                          np.array([list(row) for row in rows])) == expected
+    assert engine.findall(np.array([list(row) for row in tile_rows], dtype="S1"),
+                          np.array([list(row) for row in rows], dtype="S1")) == expected
+
+
+def test_large_modulus_rejected():
+    with pytest.raises(ValueError):
+        RabinKarp2D(PolynomialStrategy(mod=2 ** 61 - 1))
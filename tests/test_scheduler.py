@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from results.experiments import load_config, pattern_key
+from results.scheduler import _run_task, build_tasks
+
+
+def write_config(tmp_path, **time_experiment):
+    config = {
+        "texts_dir": "texts",
+        "texts": ["stih.txt"],
+        "experiments": {"time": {"hashes": ["double_hash"], "lengths": [5, 50],
+                                 "pattern": {"source": "text", "start": 100}, **time_experiment}},
+    }
+    path = tmp_path / "experiments.json"
+    path.write_text(json.dumps(config), encoding="utf-8")
+    return str(path)
+
+
+def test_engines_become_tasks(tmp_path):
+    config = load_config(write_config(tmp_path, engines=["suffix_array"], repeats=2))
+    tasks = build_tasks(config)
+    assert sorted({task[2] for task in tasks}) == ["double_hash", "suffix_array"]
+    assert len(tasks) == 2 * 2 * 2
+
+
+def test_unknown_engine_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        load_config(write_config(tmp_path, engines=["b_tree"]))
+
+
+def test_suffix_array_task_matches_rabin_karp():
+    source = pattern_key({"source": "text", "start": 100})
+    for length in (5, 50):
+        _, rk_stats, rk_position = _run_task((source, "texts/stih.txt", "double_hash", length, 0))
+        _, sa_stats, sa_position = _run_task((source, "texts/stih.txt", "suffix_array", length, 0))
+        assert sa_position == rk_position != -1
+        assert sa_stats["collisions"] == 0
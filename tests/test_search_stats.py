@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from src.double_hash import double_hash
+from src.longest_substring import longest_repeated_substring
+from src.multi_pattern import MultiPatternRabinKarp
+from src.rabin_karp import RabinKarp
+from src.rabin_karp_2d import RabinKarp2D
+from src.rabin_karp_index import RabinKarpIndex
+from src.suffix_array import SuffixArraySearch
+from src.winnowing import WinnowingDetector
+
+TEXT = "the quick brown fox jumps over the lazy dog; the quick red fox " * 20
+STATS_KEYS = {"collisions", "checks", "time_ns", "time_ms", "time_sec"}
+
+
+def run_engines():
+    rk = RabinKarp(double_hash)
+    rk.findall("fox", TEXT)
+    yield rk
+
+    multi = MultiPatternRabinKarp(double_hash, ["fox", "quick"])
+    multi.findall(TEXT)
+    yield multi
+
+    index = RabinKarpIndex(TEXT, lengths=(4,))
+    index.findall("quick")
+    yield index
+
+    suffix_array = SuffixArraySearch(TEXT)
+    suffix_array.findall("quick")
+    yield suffix_array
+
+    grid = RabinKarp2D()
+    grid.findall(["ab", "cd"], ["xabx", "xcdx"])
+    yield grid
+
+    detector = WinnowingDetector(k=10, w=5)
+    detector.add("a", TEXT)
+    detector.add("b", TEXT[::-1] + TEXT[:200])
+    detector.shared_regions()
+    yield detector
+
+    yield longest_repeated_substring(TEXT[:300])
+
+
+@pytest.mark.parametrize("engine", list(run_engines()), ids=lambda engine: type(engine).__name__)
+def test_get_stats_has_common_fields(engine):
+    stats = engine.get_stats()
+    assert STATS_KEYS <= stats.keys()
+    assert stats["checks"] >= stats["collisions"] >= 0
+    assert stats["time_ms"] == stats["time_ns"] / 1_000_000
+
+
+def test_time_excludes_consumer():
+    # Пока вызывающий код держит позицию, время поиска не идёт
+    engines = [
+        (RabinKarp(double_hash), lambda engine: engine.finditer("fox", TEXT)),
+        (MultiPatternRabinKarp(double_hash, ["fox"]), lambda engine: engine.finditer(TEXT)),
+        (RabinKarp2D(), lambda engine: engine.finditer(["a"], ["a" * 10])),
+    ]
+    for engine, search in engines:
+        positions = search(engine)
+        next(positions)
+        time.sleep(0.05)
+        for _ in positions:
+            pass
+        assert engine.time_ns < 50_000_000, type(engine).__name__
@@ -0,0 +1,32 @@
+import pytest
+
+from src.rabin_karp import RabinKarp
+from src.strategies import STRATEGIES, make_strategy
+
+TEXT = "abcdabcabcdxabcd" * 3
+ROLLING = [hash_func for hash_func, strategy_cls in STRATEGIES.items() if strategy_cls.can_roll]
+
+
+def naive(pattern, text):
+    return [i for i in range(len(text) - len(pattern) + 1) if text.startswith(pattern, i)]
+
+
+@pytest.mark.parametrize("hash_func", ROLLING, ids=lambda f: f.__name__)
+def test_roll_matches_hash_of_window(hash_func):
+    strategy = make_strategy(hash_func)
+    for text in (TEXT, TEXT.encode()):
+        for m in (1, 2, 5):
+            h, roll = strategy.init(text[:m])
+            for i in range(1, len(text) - m + 1):
+                h = roll(h, text[i - 1] if isinstance(text, bytes) else ord(text[i - 1]),
+                         text[i + m - 1] if isinstance(text, bytes) else ord(text[i + m - 1]))
+                assert h == strategy(text[i:i + m])
+
+
+@pytest.mark.parametrize("hash_func", ROLLING, ids=lambda f: f.__name__)
+def test_interleaved_scans_share_strategy(hash_func):
+    # Два незавершённых finditer на одном экземпляре не портят скольжение друг друга
+    rk = RabinKarp(make_strategy(hash_func))
+    pairs = list(zip(rk.finditer("abc", TEXT), rk.finditer("abcd", TEXT)))
+    expected = list(zip(naive("abc", TEXT), naive("abcd", TEXT)))
+    assert pairs == expected
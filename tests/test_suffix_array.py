@@ -0,0 +1,17 @@
+from src.double_hash import double_hash
+from src.rabin_karp import RabinKarp
+from src.suffix_array import SUFFIX_ARRAY_BUILD_PASSES, SuffixArraySearch, select_engine
+
+TEXT = "abracadabra, abrakadabra " * 10
+
+
+def test_findall_matches_rabin_karp():
+    suffix_array = SuffixArraySearch(TEXT)
+    for pattern in ("abra", "a", "dabra,", "нет"):
+        assert sorted(suffix_array.findall(pattern)) == RabinKarp(double_hash).findall(pattern, TEXT)
+
+
+def test_select_engine_threshold():
+    assert not isinstance(select_engine(TEXT, SUFFIX_ARRAY_BUILD_PASSES), SuffixArraySearch)
+    assert isinstance(select_engine(TEXT, SUFFIX_ARRAY_BUILD_PASSES + 1), SuffixArraySearch)
+    assert isinstance(select_engine(TEXT, 2, build_passes=1), SuffixArraySearch)
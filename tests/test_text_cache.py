@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+
+from src import numpy_backend
+from src.double_hash import M1, P1
+from src.text_cache import TextCache, decode_text
+
+
+def test_text_round_trip_and_reuse(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_text("Война и мир — ü\n" * 100, encoding="utf-8")
+    cache = TextCache(str(tmp_path / "cache"))
+
+    assert cache.text(str(path)) == path.read_text(encoding="utf-8")
+    entry = tmp_path / "cache" / cache.digest(str(path)) / "codes.npy"
+    assert entry.exists()
+    # Повторное чтение - из кеша, тот же текст
+    assert cache.text(str(path)) == path.read_text(encoding="utf-8")
+
+
+def test_decode_text():
+    assert decode_text("abc".encode("utf-8")) == "abc"
+    assert decode_text("мир".encode("utf-8")) == "мир"
+    assert decode_text("мир".encode("utf-8-sig")) == "мир"
+    assert decode_text("мир".encode("cp1251")) == "мир".encode("cp1251").decode("latin-1")
+    assert decode_text("мир".encode("utf-16")) == "мир"
+    assert decode_text("мир".encode("utf-32")) == "мир"
+
+
+def test_eviction_keeps_current_entry(tmp_path):
+    cache = TextCache(str(tmp_path / "cache"), max_bytes=1)
+    for name in ("a.txt", "b.txt"):
+        (tmp_path / name).write_text(name * 50, encoding="utf-8")
+        assert cache.text(str(tmp_path / name)) == name * 50
+    entries = [entry for entry in os.scandir(tmp_path / "cache") if entry.is_dir()]
+    assert [entry.name for entry in entries] == [cache.digest(str(tmp_path / "b.txt"))]
+
+
+def test_polynomial_arrays_cached(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_text("abracadabra мир " * 20, encoding="utf-8")
+    cache = TextCache(str(tmp_path / "cache"))
+
+    prefix, pw = cache.polynomial_arrays(str(path), P1, M1)
+    expected = numpy_backend.polynomial_prefix(numpy_backend.encode_text(path.read_text(encoding="utf-8")), P1, M1)
+    assert np.array_equal(prefix, expected[0]) and np.array_equal(pw, expected[1])
+    entry = tmp_path / "cache" / cache.digest(str(path))
+    assert (entry / f"poly_prefix_{P1}_{M1}.npy").exists()
+    assert (entry / f"poly_powers_{P1}_{M1}.npy").exists()